@@ -18,6 +18,8 @@ class GrobidService:
 
     GROBID_URL = "http://localhost:8070"
     GROBID_IMAGE = "lfoppiano/grobid:0.8.1"
+    # Number of requests processed concurrently by GROBID (default: concurrency=10)
+    N_CONCURRENT_REQUESTS = 10
 
     def __init__(
         self,
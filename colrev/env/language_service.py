@@ -16,6 +16,8 @@ class LanguageService:
     """Service to detect languages and handle language codes"""
 
     _eng_false_negatives = ["editorial", "introduction"]
+    # Common ISO 639-1 codes (mapped without the language service in load formatting)
+    ISO_639_1_TO_3 = {"en": "eng", "fr": "fra", "ar": "ara", "de": "deu"}
 
     def __init__(self) -> None:
         # Note : Lingua is tested/evaluated relative to other libraries:
@@ -134,23 +136,14 @@ class LanguageService:
         if Fields.LANGUAGE not in record.data:
             return
 
-        if record.data[Fields.LANGUAGE].lower() in ["en"]:
-            record.data[Fields.LANGUAGE] = "eng"
-
-        elif record.data[Fields.LANGUAGE].lower() in ["fr"]:
-            record.data[Fields.LANGUAGE] = "fra"
-
-        elif record.data[Fields.LANGUAGE].lower() in ["ar"]:
-            record.data[Fields.LANGUAGE] = "ara"
-
-        elif record.data[Fields.LANGUAGE].lower() in ["de"]:
-            record.data[Fields.LANGUAGE] = "deu"
-
-        if len(record.data[Fields.LANGUAGE]) != 3:
-            if record.data[Fields.LANGUAGE].lower() in self._lang_code_mapping:
-                record.data[Fields.LANGUAGE] = self._lang_code_mapping[
-                    record.data[Fields.LANGUAGE].lower()
-                ]
+        language = record.data[Fields.LANGUAGE].lower()
+        if language in self.ISO_639_1_TO_3:
+            record.data[Fields.LANGUAGE] = self.ISO_639_1_TO_3[language]
+        elif (
+            len(record.data[Fields.LANGUAGE]) != 3
+            and language in self._lang_code_mapping
+        ):
+            record.data[Fields.LANGUAGE] = self._lang_code_mapping[language]
 
         self.validate_iso_639_3_language_codes(
             lang_code_list=[record.data[Fields.LANGUAGE]]
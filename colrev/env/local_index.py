@@ -45,10 +45,12 @@ class LocalIndex:
         return sqlite_index_ranking.select(journal=journal)
 
     def _retrieve_based_on_colrev_id(
-        self, cids_to_retrieve: list
+        self,
+        cids_to_retrieve: list,
+        *,
+        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
     ) -> colrev.record.record.Record:
 
-        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
         for cid_to_retrieve in cids_to_retrieve:
             try:
                 retrieved_record = sqlite_index_record.get(
@@ -58,8 +60,6 @@ class LocalIndex:
 
             except colrev_exceptions.RecordNotInIndexException:
                 continue  # continue with the next cid_to_retrieve
-            finally:
-                sqlite_index_record.connection.close()
 
         raise colrev_exceptions.RecordNotInIndexException(cids_to_retrieve[0])
 
@@ -92,12 +92,17 @@ class LocalIndex:
         return colrev.record.record.Record(ret[record_id])
 
     def _retrieve_from_record_index(
-        self, record_dict: dict
+        self,
+        record_dict: dict,
+        *,
+        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
     ) -> colrev.record.record.Record:
 
         record = colrev.record.record.Record(record_dict)
         cids_to_retrieve = [record.get_colrev_id()]
-        retrieved_record = self._retrieve_based_on_colrev_id(cids_to_retrieve)
+        retrieved_record = self._retrieve_based_on_colrev_id(
+            cids_to_retrieve, sqlite_index_record=sqlite_index_record
+        )
         if retrieved_record.data[Fields.ENTRYTYPE] != record.data[Fields.ENTRYTYPE]:
             if record_dict.get(Fields.CURATION_ID, "NA").startswith(
                 "https://github.com/"
@@ -268,24 +273,23 @@ class LocalIndex:
             sqlite_index_record.connection.close()
         return record_to_import
 
-    def retrieve(
+    def _retrieve(
         self,
         record_dict: dict,
         *,
-        include_file: bool = False,
-        include_colrev_ids: bool = False,
+        sqlite_index_record: colrev.env.local_index_sqlite.SQLiteIndexRecord,
+        include_file: bool,
+        include_colrev_ids: bool,
     ) -> colrev.record.record.Record:
-        """
-        Convenience function to retrieve the indexed record_dict metadata
-        based on another record_dict
-        """
 
         # To avoid modifications to the original record
         record_dict = deepcopy(record_dict)
 
         # 1. Try the record index
         try:
-            retrieved_record = self._retrieve_from_record_index(record_dict)
+            retrieved_record = self._retrieve_from_record_index(
+                record_dict, sqlite_index_record=sqlite_index_record
+            )
             retrieved_record_dict = retrieved_record.data
         except (
             colrev_exceptions.RecordNotInIndexException,
@@ -310,15 +314,7 @@ class LocalIndex:
                     or Fields.ID == key
                 ):
                     continue
-                try:
-                    sqlite_index_record = (
-                        colrev.env.local_index_sqlite.SQLiteIndexRecord()
-                    )
-                    retrieved_record_dict = sqlite_index_record.get(
-                        key=key, value=value
-                    )
-                finally:
-                    sqlite_index_record.connection.close()
+                retrieved_record_dict = sqlite_index_record.get(key=key, value=value)
 
                 if key in retrieved_record_dict:
                     if retrieved_record_dict[key] == value:
@@ -338,6 +334,63 @@ class LocalIndex:
             include_colrev_ids=include_colrev_ids,
         )
 
+    def retrieve(
+        self,
+        record_dict: dict,
+        *,
+        include_file: bool = False,
+        include_colrev_ids: bool = False,
+    ) -> colrev.record.record.Record:
+        """
+        Convenience function to retrieve the indexed record_dict metadata
+        based on another record_dict
+        """
+
+        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        try:
+            return self._retrieve(
+                record_dict,
+                sqlite_index_record=sqlite_index_record,
+                include_file=include_file,
+                include_colrev_ids=include_colrev_ids,
+            )
+        finally:
+            sqlite_index_record.connection.close()
+
+    def retrieve_many(
+        self,
+        record_dicts: typing.List[dict],
+        *,
+        include_file: bool = False,
+    ) -> typing.List[typing.Optional[colrev.record.record.Record]]:
+        """
+        Retrieve the indexed metadata for a list of record_dicts
+        (using one connection to the index).
+        Records that are not in the index are returned as None.
+        """
+
+        retrieved_records: list = []
+        sqlite_index_record = colrev.env.local_index_sqlite.SQLiteIndexRecord()
+        try:
+            for record_dict in record_dicts:
+                try:
+                    retrieved_records.append(
+                        self._retrieve(
+                            record_dict,
+                            sqlite_index_record=sqlite_index_record,
+                            include_file=include_file,
+                            include_colrev_ids=False,
+                        )
+                    )
+                except (
+                    colrev_exceptions.RecordNotInIndexException,
+                    colrev_exceptions.NotEnoughDataToIdentifyException,
+                ):
+                    retrieved_records.append(None)
+        finally:
+            sqlite_index_record.connection.close()
+        return retrieved_records
+
     def get_fields_to_remove(self, record_dict: dict) -> list:
         """Compares the record to available toc items and
         returns fields to remove (if any), such as the volume or number."""
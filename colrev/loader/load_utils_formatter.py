@@ -2,8 +2,10 @@
 """Convenience functions for load formatting"""
 from __future__ import annotations
 
+import functools
 import html
 import re
+import typing
 
 import colrev.env.language_service
 import colrev.exceptions as colrev_exceptions
@@ -13,6 +15,41 @@ from colrev.constants import RecordState
 
 # pylint: disable=too-few-public-methods
 
+# Note : tags do not span lines (comparison signs in abstracts)
+HTML_TAG_PATTERN = re.compile(r"<.*?>")
+DOI_RESOLVER_PATTERN = re.compile(r"^https?://(?:dx\.)?doi\.org/")
+
+
+def _get_prefix_tree_regex(strings: typing.Iterable[str]) -> str:
+    """Get a regex alternation of the strings, factored by common prefixes"""
+    # Note : at each position, only alternatives sharing the next character are
+    # tried, and longer matches are preferred (greedy optional suffixes)
+    prefix_tree: dict = {}
+    for string in strings:
+        node = prefix_tree
+        for char in string:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def _node_to_regex(node: dict) -> str:
+        alternatives = [
+            re.escape(char) + _node_to_regex(child)
+            for char, child in sorted(node.items())
+            if char
+        ]
+        if not alternatives:
+            return ""
+        regex = (
+            alternatives[0]
+            if len(alternatives) == 1
+            else f"(?:{'|'.join(alternatives)})"
+        )
+        if "" in node:
+            regex = f"(?:{regex})?"
+        return regex
+
+    return _node_to_regex(prefix_tree)
+
 
 class LoadFormatter:
     """Load formatter class"""
@@ -39,23 +76,33 @@ class LoadFormatter:
         '"o': "ö",
         '"u': "ü",
     }
-
-    _FIELDS_TO_PROCESS = [
-        Fields.AUTHOR,
-        Fields.YEAR,
-        Fields.TITLE,
-        Fields.JOURNAL,
-        Fields.BOOKTITLE,
-        Fields.SERIES,
-        Fields.VOLUME,
-        Fields.NUMBER,
-        Fields.PAGES,
-        Fields.DOI,
-        Fields.ABSTRACT,
-    ]
+    # Longest sequences first, each with or without enclosing braces (single pass)
+    _LATEX_SPECIAL_CHARS = _get_prefix_tree_regex(_LATEX_SPECIAL_CHAR_MAPPING)
+    _LATEX_SPECIAL_CHAR_PATTERN = re.compile(
+        rf"\{{({_LATEX_SPECIAL_CHARS})\}}|({_LATEX_SPECIAL_CHARS})"
+    )
+
+    _FIELDS_TO_PROCESS = frozenset(
+        {
+            Fields.AUTHOR,
+            Fields.YEAR,
+            Fields.TITLE,
+            Fields.JOURNAL,
+            Fields.BOOKTITLE,
+            Fields.SERIES,
+            Fields.VOLUME,
+            Fields.NUMBER,
+            Fields.PAGES,
+            Fields.DOI,
+            Fields.ABSTRACT,
+        }
+    )
 
     def __init__(self) -> None:
-        self.language_service = colrev.env.language_service.LanguageService()
+        # Note : the language service (language detector) is initialized lazily
+        self._language_service: typing.Optional[
+            colrev.env.language_service.LanguageService
+        ] = None
 
     def _fix_author_particles(self, record: colrev.record.record.Record) -> None:
         # Fix the name particles in the author field
@@ -94,19 +141,22 @@ class LoadFormatter:
 
     def _format_doi(self, record: colrev.record.record.Record) -> None:
         if Fields.DOI in record.data:
-            record.data[Fields.DOI] = (
-                record.data[Fields.DOI]
-                .lower()
-                .replace("https://", "http://")
-                .replace("dx.doi.org", "doi.org")
-                .replace("http://doi.org/", "")
-                .upper()
-            )
+            # Note : the scheme is only removed with the (dx.)doi.org resolver
+            record.data[Fields.DOI] = DOI_RESOLVER_PATTERN.sub(
+                "", record.data[Fields.DOI].lower()
+            ).upper()
 
     def _unify_language(self, record: colrev.record.record.Record) -> None:
         if Fields.LANGUAGE in record.data and len(record.data[Fields.LANGUAGE]) != 3:
+            language = record.data[Fields.LANGUAGE].lower()
+            iso_639_1_to_3 = colrev.env.language_service.LanguageService.ISO_639_1_TO_3
+            if language in iso_639_1_to_3:
+                record.data[Fields.LANGUAGE] = iso_639_1_to_3[language]
+                return
+            if self._language_service is None:
+                self._language_service = colrev.env.language_service.LanguageService()
             try:
-                self.language_service.unify_to_iso_639_3_language_codes(record=record)
+                self._language_service.unify_to_iso_639_3_language_codes(record=record)
             except colrev_exceptions.InvalidLanguageCodeException:
                 del record.data[Fields.LANGUAGE]
 
@@ -123,55 +173,66 @@ class LoadFormatter:
         self._unify_language(record)
         self._rename_issue_to_number(record)
 
-    def _unescape_latex(self, *, input_str: str) -> str:
-        for latex_char, repl_char in self._LATEX_SPECIAL_CHAR_MAPPING.items():
-            input_str = input_str.replace(f"{{{latex_char}}}", repl_char)
-            input_str = input_str.replace(latex_char, repl_char)
-        return input_str
-
-    def _unescape_html(self, *, input_str: str) -> str:
-        input_str = html.unescape(input_str)
+    # Note : values are cached because journal, booktitle, and author values
+    # repeat across records (static methods: the cache does not keep self alive)
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _unescape_latex(*, input_str: str) -> str:
+        return LoadFormatter._LATEX_SPECIAL_CHAR_PATTERN.sub(
+            lambda match: LoadFormatter._LATEX_SPECIAL_CHAR_MAPPING[
+                match.group(1) or match.group(2)
+            ],
+            input_str,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _unescape_html(*, input_str: str) -> str:
+        if "&" in input_str:
+            input_str = html.unescape(input_str)
         if "<" in input_str:
-            input_str = re.sub(r"<.*?>", "", input_str)
+            input_str = HTML_TAG_PATTERN.sub("", input_str)
         return input_str
 
     def _unescape_field_values(self, *, record: colrev.record.record.Record) -> None:
-        for field in record.data:
-            if field not in self._FIELDS_TO_PROCESS:
-                continue
-            record.data[field] = str(record.data[field])
-            if "\\" in record.data[field]:
-                record.data[field] = self._unescape_latex(input_str=record.data[field])
-            record.data[field] = self._unescape_html(input_str=record.data[field])
+        data = record.data
+        for field in data.keys() & self._FIELDS_TO_PROCESS:
+            value = str(data[field])
+            if "\\" in value:
+                value = self._unescape_latex(input_str=value)
+            if "&" in value or "<" in value:
+                value = self._unescape_html(input_str=value)
 
-            record.data[field] = record.data[field].replace("\n", " ").rstrip().lstrip()
+            data[field] = value.replace("\n", " ").strip()
 
     def _standardize_field_values(self, *, record: colrev.record.record.Record) -> None:
-        if record.data.get(Fields.TITLE, FieldValues.UNKNOWN) != FieldValues.UNKNOWN:
-            record.data[Fields.TITLE] = re.sub(
-                r"\s+", " ", record.data[Fields.TITLE]
-            ).rstrip(".")
+        data = record.data
+        if data.get(Fields.TITLE, FieldValues.UNKNOWN) != FieldValues.UNKNOWN:
+            data[Fields.TITLE] = " ".join(data[Fields.TITLE].split()).rstrip(".")
 
         # Fix floating point years
-        if Fields.YEAR in record.data and str(record.data[Fields.YEAR]).endswith(".0"):
-            record.data[Fields.YEAR] = str(record.data[Fields.YEAR])[:-2]
-
-        if Fields.PAGES in record.data:
-            record.data[Fields.PAGES] = record.data[Fields.PAGES].replace("–", "--")
-            if record.data[Fields.PAGES].count("-") == 1:
-                record.data[Fields.PAGES] = record.data[Fields.PAGES].replace("-", "--")
-            if record.data[Fields.PAGES].lower() == "n.pag":
-                del record.data[Fields.PAGES]
-
-        if record.data.get(Fields.VOLUME, "") == "ahead-of-print":
-            del record.data[Fields.VOLUME]
-        if record.data.get(Fields.NUMBER, "") == "ahead-of-print":
-            del record.data[Fields.NUMBER]
-
-        if Fields.URL in record.data and "login?url=https" in record.data[Fields.URL]:
-            record.data[Fields.URL] = record.data[Fields.URL][
-                record.data[Fields.URL].find("login?url=https") + 10 :
-            ]
+        if Fields.YEAR in data:
+            data[Fields.YEAR] = str(data[Fields.YEAR]).removesuffix(".0")
+
+        if Fields.PAGES in data:
+            pages = data[Fields.PAGES].replace("–", "--")
+            if pages.count("-") == 1:
+                pages = pages.replace("-", "--")
+            if pages.lower() == "n.pag":
+                del data[Fields.PAGES]
+            else:
+                data[Fields.PAGES] = pages
+
+        if data.get(Fields.VOLUME, "") == "ahead-of-print":
+            del data[Fields.VOLUME]
+        if data.get(Fields.NUMBER, "") == "ahead-of-print":
+            del data[Fields.NUMBER]
+
+        # Remove (institutional) login proxies
+        if Fields.URL in data:
+            _, login_url, target_url = data[Fields.URL].partition("login?url=")
+            if login_url and target_url.startswith("https"):
+                data[Fields.URL] = target_url
 
     def run(self, record: colrev.record.record.Record) -> None:
         """Run the load formatter"""
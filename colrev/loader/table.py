@@ -38,29 +38,24 @@ class TableLoader(colrev.loader.loader.Loader):
             logger=logger,
         )
 
+    @staticmethod
+    def _read_table(filename: Path) -> pd.DataFrame:
+        if filename.name.endswith(".csv"):
+            return pd.read_csv(filename)
+        if filename.name.endswith((".xls", ".xlsx")):
+            # dtype=str to avoid type casting
+            return pd.read_excel(filename, dtype=str)
+        raise NotImplementedError
+
     @classmethod
     def get_nr_records(cls, filename: Path) -> int:
         """Get the number of records in the file"""
-        if filename.name.endswith(".csv"):
-            data = pd.read_csv(filename)
-        elif filename.name.endswith((".xls", ".xlsx")):
-            data = pd.read_excel(filename, dtype=str)
-        else:
-            raise NotImplementedError
-        count = len(data)
+        count = len(cls._read_table(filename))
         return count
 
     def load_records_list(self) -> list:
         try:
-            if self.filename.name.endswith(".csv"):
-                data = pd.read_csv(self.filename)
-            elif self.filename.name.endswith((".xls", ".xlsx")):
-                data = pd.read_excel(
-                    self.filename, dtype=str
-                )  # dtype=str to avoid type casting
-            else:
-                raise NotImplementedError
-
+            data = self._read_table(self.filename)
         except pd.errors.ParserError as exc:  # pragma: no cover
             raise colrev_exceptions.ImportException(
                 f"Error: Not a valid file? {self.filename.name}"
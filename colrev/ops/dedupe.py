@@ -5,11 +5,11 @@ from __future__ import annotations
 import string
 import typing
 from collections import defaultdict
+from itertools import chain
 from itertools import combinations
 from pathlib import Path
 
 import pandas as pd
-from bib_dedupe.bib_dedupe import prep
 
 import colrev.exceptions as colrev_exceptions
 import colrev.process.operation
@@ -99,6 +99,11 @@ class Dedupe(colrev.process.operation.Operation):
         cls, *, records_df: pd.DataFrame, verbosity_level: int = 0
     ) -> pd.DataFrame:
         """Get (pre-processed) records for dedupe"""
+        # pylint: disable=import-outside-toplevel
+        # Note : bib_dedupe is only needed when records are prepared for dedupe
+        # (not for merges/unmerges)
+        from bib_dedupe.bib_dedupe import prep
+
         return prep(records_df=records_df, verbosity_level=verbosity_level)
 
     def _select_primary_merge_record(self, rec_1: dict, rec_2: dict) -> list:
@@ -333,16 +338,6 @@ class Dedupe(colrev.process.operation.Operation):
             )
             return True
 
-        # if (
-        #     self._same_source_merge(main_record=main_record, dupe_record=dupe_record)
-        #     and self.policy == colrev.settings.SameSourceMergePolicy.prevent
-        # ):
-        #     self.review_manager.logger.info(
-        #         "Prevented same-source merge: "
-        #         f"{main_record.data[Fields.ID]} - {dupe_record.data[Fields.ID]}"
-        #     )
-        #     return True
-
         return False
 
     def _update_duplicate_id_mappings(
@@ -384,9 +379,7 @@ class Dedupe(colrev.process.operation.Operation):
 
         records = self.review_manager.dataset.load_records_dict()
         non_existing_ids = [
-            ID
-            for ID in [id for id_set in id_sets for id in id_set]
-            if ID not in records
+            ID for ID in chain.from_iterable(id_sets) if ID not in records
         ]
         if non_existing_ids:
             print(f"Non-existing IDs: {non_existing_ids}")
@@ -394,18 +387,20 @@ class Dedupe(colrev.process.operation.Operation):
         assert not non_existing_ids, "Not all IDs from id_sets are present in records"
 
         # Notify users about items with only one unique ID
+        # and drop cases where IDs are identical
+        id_sets_to_merge = []
         for id_set in id_sets:
             if len(set(id_set)) == 1:
                 self.review_manager.logger.info(
                     f"Skipping merge for identical IDs: {id_set[0]}"
                 )
-        # Drop cases where IDs are identical
-        id_sets = [id_set for id_set in id_sets if len(set(id_set)) != 1]
+                continue
+            id_sets_to_merge.append(id_set)
 
         removed_duplicates = []
         duplicate_id_mappings: typing.Dict[str, list] = {}
         for main_record, dupe_record in self._get_records_to_merge(
-            records=records, id_sets=id_sets
+            records=records, id_sets=id_sets_to_merge
         ):
             if self._skip_merge_condition(
                 main_record=main_record, dupe_record=dupe_record
@@ -482,10 +477,6 @@ class Dedupe(colrev.process.operation.Operation):
         ids_origins: typing.Dict[str, typing.List[str]] = {
             rid: [] for rid in current_record_ids
         }
-        # history = next(self.review_manager.dataset.load_records_from_history(), None)
-        # if history:
-        #     for rid in ids_origins:
-        #         ids_origins[rid] = history.get(rid, {}).get(Fields.ORIGIN, [])
 
         records = self.review_manager.dataset.load_records_dict()
         for rid in ids_origins:
@@ -589,13 +580,6 @@ class Dedupe(colrev.process.operation.Operation):
     def get_info(self) -> dict:
         """Get info on cuts (overlap of search sources) and same source merges"""
 
-        # same_source_merges: typing.Any = []
-        # source_overlaps: typing.Any = []
-        # info = {
-        #     "same_source_merges": same_source_merges,
-        #     "source_overlaps": source_overlaps,
-        # }
-        # return info
         raise NotImplementedError
 
     def merge_records(self, *, merge: list) -> None:
@@ -2,6 +2,7 @@
 """CoLRev pdf_prep operation: Prepare PDF documents."""
 from __future__ import annotations
 
+import functools
 import multiprocessing as mp
 import os
 import shutil
@@ -10,6 +11,7 @@ from pathlib import Path
 
 import requests
 
+import colrev.env.grobid_service
 import colrev.exceptions as colrev_exceptions
 import colrev.packages.grobid_tei.src.grobid_tei
 import colrev.process.operation
@@ -361,6 +363,23 @@ class PDFPrep(colrev.process.operation.Operation):
 
         self.review_manager.save_settings()
 
+    # Note : no named arguments (multiprocessing)
+    def _generate_tei(
+        self,
+        endpoint: colrev.packages.grobid_tei.src.grobid_tei.GROBIDTEI,
+        record_dict: dict,
+    ) -> None:
+        self.review_manager.logger.info(record_dict[Fields.ID])
+        try:
+            endpoint.prep_pdf(
+                record=colrev.record.record_pdf.PDFRecord(
+                    record_dict, path=self.review_manager.path
+                ),
+                pad=0,
+            )
+        except colrev_exceptions.TEIException:
+            self.review_manager.logger.error("Error generating TEI")
+
     def generate_tei(self) -> None:
         """Generate TEI documents for included records"""
 
@@ -369,22 +388,21 @@ class PDFPrep(colrev.process.operation.Operation):
             pdf_prep_operation=self, settings={"endpoint": "colrev.grobid_tei"}
         )
         records = self.review_manager.dataset.load_records_dict()
-        for record_dict in records.values():
-            if record_dict[Fields.STATUS] not in [
+        records_to_process = [
+            record_dict
+            for record_dict in records.values()
+            if record_dict[Fields.STATUS]
+            in [
                 RecordState.rev_included,
                 RecordState.rev_synthesized,
-            ]:
-                continue
-            self.review_manager.logger.info(record_dict[Fields.ID])
-            try:
-                endpoint.prep_pdf(
-                    record=colrev.record.record_pdf.PDFRecord(
-                        record_dict, path=self.review_manager.path
-                    ),
-                    pad=0,
-                )
-            except colrev_exceptions.TEIException:
-                self.review_manager.logger.error("Error generating TEI")
+            ]
+        ]
+        # GROBID processes requests concurrently:
+        # send the PDFs in parallel instead of one at a time
+        pool = Pool(colrev.env.grobid_service.GrobidService.N_CONCURRENT_REQUESTS)
+        pool.map(functools.partial(self._generate_tei, endpoint), records_to_process)
+        pool.close()
+        pool.join()
 
     @colrev.process.operation.Operation.decorate()
     def main(
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import inspect
+import itertools
 import logging
 import multiprocessing as mp
 import random
@@ -12,7 +13,6 @@ from copy import deepcopy
 from datetime import datetime
 from datetime import timedelta
 from multiprocessing import Lock
-from multiprocessing import Value
 from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
 
@@ -42,7 +42,8 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 # logging.getLogger("urllib3").setLevel(logging.ERROR)
 logging.getLogger("requests_cache").setLevel(logging.ERROR)
 
-PREP_COUNTER = Value("i", 0)
+# Note : next() on itertools.count is atomic (no lock needed in the ThreadPool)
+PREP_COUNTER = itertools.count(1)
 
 
 class PreparationBreak(Exception):
@@ -75,6 +76,8 @@ class Prep(colrev.process.operation.Operation):
 
     _cpu = 1
     _prep_commit_id = "HEAD"
+    # Number of prepared records buffered before they are appended to the temp file
+    _temp_records_buffer_size = 20
 
     type = OperationsType.prep
 
@@ -98,6 +101,7 @@ class Prep(colrev.process.operation.Operation):
         self._stats: typing.Dict[str, typing.List[timedelta]] = {}
 
         self.temp_prep_lock = Lock()
+        self._temp_records_buffer: typing.List[str] = []
         self.current_temp_records = self.review_manager.path / Path(
             ".colrev/cur_temp_recs.bib"
         )
@@ -168,20 +172,16 @@ class Prep(colrev.process.operation.Operation):
 
     def _package_prep(
         self,
+        endpoint_key: str,
         prep_round_package_endpoint: dict,
         record: colrev.record.record_prep.PrepRecord,
         preparation_record: colrev.record.record_prep.PrepRecord,
     ) -> None:
 
         try:
-            if (
-                prep_round_package_endpoint["endpoint"].lower()
-                not in self.prep_package_endpoints
-            ):
+            if endpoint_key not in self.prep_package_endpoints:
                 return
-            endpoint = self.prep_package_endpoints[
-                prep_round_package_endpoint["endpoint"].lower()
-            ]
+            endpoint = self.prep_package_endpoints[endpoint_key]
 
             prior = preparation_record.copy_prep_rec()
 
@@ -201,13 +201,13 @@ class Prep(colrev.process.operation.Operation):
             if endpoint.always_apply_changes:
                 record.update_by_record(preparation_record)
 
-            if self._preparation_save_condition(preparation_record):
+            break_condition, save_condition = self._preparation_conditions(
+                preparation_record
+            )
+            if save_condition:
                 record.update_by_record(preparation_record)
 
-            if (
-                self._preparation_break_condition(preparation_record)
-                and not self.polish
-            ):
+            if break_condition and not self.polish:
                 record.update_by_record(preparation_record)
                 raise PreparationBreak
         except ReadTimeout:
@@ -278,47 +278,25 @@ class Prep(colrev.process.operation.Operation):
                 + f"{progress}{prior_state} →  {record.data[Fields.STATUS]}{Colors.END}"
             )
 
-    def _preparation_break_condition(
+    def _preparation_conditions(
         self, record: colrev.record.record_prep.PrepRecord
-    ) -> bool:
-        """Check whether the break condition for the prep operation is given"""
+    ) -> typing.Tuple[bool, bool]:
+        """Check whether the break and save conditions for the prep operation are given"""
 
-        if DefectCodes.RECORD_NOT_IN_TOC in record.get_field_provenance_notes(
+        # Note : the provenance notes are checked once for both conditions
+        not_in_toc = DefectCodes.RECORD_NOT_IN_TOC in record.get_field_provenance_notes(
             Fields.JOURNAL
-        ):
-            return True
-        if DefectCodes.RECORD_NOT_IN_TOC in record.get_field_provenance_notes(
+        ) or DefectCodes.RECORD_NOT_IN_TOC in record.get_field_provenance_notes(
             Fields.BOOKTITLE
-        ):
-            return True
-
-        if record.data.get(Fields.STATUS, "NA") in [
-            RecordState.rev_prescreen_excluded,
-        ]:
-            return True
-        return False
-
-    def _preparation_save_condition(
-        self, record: colrev.record.record_prep.PrepRecord
-    ) -> bool:
-        """Check whether the save condition for the prep operation is given"""
+        )
+        status = record.data.get(Fields.STATUS, "NA")
 
-        if record.data[Fields.STATUS] in [
+        break_condition = not_in_toc or status == RecordState.rev_prescreen_excluded
+        save_condition = not_in_toc or status in [
             RecordState.rev_prescreen_excluded,
             RecordState.md_prepared,
-        ]:
-            return True
-
-        if DefectCodes.RECORD_NOT_IN_TOC in record.get_field_provenance_notes(
-            Fields.JOURNAL
-        ):
-            return True
-        if DefectCodes.RECORD_NOT_IN_TOC in record.get_field_provenance_notes(
-            Fields.BOOKTITLE
-        ):
-            return True
-
-        return False
+        ]
+        return break_condition, save_condition
 
     def _status_to_prepare(self, record: colrev.record.record_prep.PrepRecord) -> bool:
         """Check whether the record needs to be prepared"""
@@ -335,13 +313,13 @@ class Prep(colrev.process.operation.Operation):
         prior_state: RecordState,
     ) -> None:
         # pylint: disable=redefined-outer-name,invalid-name
-        with PREP_COUNTER.get_lock():
-            PREP_COUNTER.value += 1  # type: ignore
+        count = next(PREP_COUNTER)
+        # Note : skip formatting the progress lines if they are not logged
+        if not self.review_manager.logger.isEnabledFor(logging.INFO):
+            return
         progress = ""
         if item["nr_items"] > 100:
-            progress = f"({PREP_COUNTER.value}/{item['nr_items']}) ".rjust(  # type: ignore
-                12, " "
-            )
+            progress = f"({count}/{item['nr_items']}) ".rjust(12, " ")
 
         if self.polish:
             self._print_post_package_prep_polish_info(
@@ -349,7 +327,8 @@ class Prep(colrev.process.operation.Operation):
             )
             return
 
-        if self._preparation_break_condition(record):
+        break_condition, save_condition = self._preparation_conditions(record)
+        if break_condition:
             if RecordState.rev_prescreen_excluded == record.data[Fields.STATUS]:
                 target_state = RecordState.rev_prescreen_excluded
                 self.review_manager.logger.info(
@@ -365,7 +344,7 @@ class Prep(colrev.process.operation.Operation):
                     + f"{progress}{prior_state} →  {target_state}{Colors.END}"
                 )
 
-        elif self._preparation_save_condition(record):
+        elif save_condition:
             curation_addition = "   "
             if record.masterdata_is_curated():
                 curation_addition = " ✔ "
@@ -414,14 +393,27 @@ class Prep(colrev.process.operation.Operation):
             implementation="bib",
         )
         self.temp_prep_lock.acquire(timeout=120)
-        self.current_temp_records.parent.mkdir(exist_ok=True)
-        with open(self.current_temp_records, "a", encoding="utf-8") as cur_temp_rec:
-            cur_temp_rec.write(rec_str)
+        self._temp_records_buffer.append(rec_str)
+        if len(self._temp_records_buffer) >= self._temp_records_buffer_size:
+            self._write_temp_records_buffer()
         try:
             self.temp_prep_lock.release()
         except ValueError:
             pass
 
+    def _flush_temp_records(self) -> None:
+        with self.temp_prep_lock:
+            self._write_temp_records_buffer()
+
+    def _write_temp_records_buffer(self) -> None:
+        # Note : requires the temp_prep_lock
+        if not self._temp_records_buffer:
+            return
+        self.current_temp_records.parent.mkdir(exist_ok=True)
+        with open(self.current_temp_records, "a", encoding="utf-8") as cur_temp_rec:
+            cur_temp_rec.writelines(self._temp_records_buffer)
+        self._temp_records_buffer.clear()
+
     def _complete_resumed_operation(self, prepared_records: list) -> None:
         if self.temp_records.is_file():
             temp_recs = colrev.loader.load_utils.load(
@@ -506,11 +498,12 @@ class Prep(colrev.process.operation.Operation):
             self.quality_model, set_prepared=not self.polish
         )
 
-        for prep_round_package_endpoint in deepcopy(
-            item["prep_round_package_endpoints"]
-        ):
+        for endpoint_key, prep_round_package_endpoint in item[
+            "prep_round_package_endpoints"
+        ]:
             try:
                 self._package_prep(
+                    endpoint_key,
                     prep_round_package_endpoint,
                     record,
                     preparation_record,
@@ -625,12 +618,12 @@ class Prep(colrev.process.operation.Operation):
             and self.review_manager.in_ci_environment()
             and len(items) > 2000
         ):
-            items = random.choices(items, k=2000)  # nosec
+            items = random.sample(items, k=2000)  # nosec
 
         prep_data = {
             "nr_tasks": len(items),
             "PAD": pad,
-            "items": list(items),
+            "items": items,
         }
 
         return prep_data
@@ -681,8 +674,9 @@ class Prep(colrev.process.operation.Operation):
                 x for x in prepare_data["items"] if x[Fields.ID] not in list_to_skip
             ]
 
-            with PREP_COUNTER.get_lock():
-                PREP_COUNTER.value += skipped_items  # type: ignore
+            # pylint: disable=global-statement
+            global PREP_COUNTER
+            PREP_COUNTER = itertools.count(skipped_items + 1)
 
     def _get_prep_data_tasks(
         self,
@@ -696,6 +690,11 @@ class Prep(colrev.process.operation.Operation):
         items = prepare_data["items"]
         prep_data = []
         nr_items = len(prepare_data["items"])
+        # Note : the endpoint keys are normalized once per round (not per record)
+        prep_round_package_endpoints = tuple(
+            (prep_package_endpoint["endpoint"].lower(), prep_package_endpoint)
+            for prep_package_endpoint in prep_round.prep_package_endpoints
+        )
         for item in items:
             prep_data.append(
                 {
@@ -704,7 +703,7 @@ class Prep(colrev.process.operation.Operation):
                     # Note : we cannot load endpoints here
                     # because pathos/multiprocessing
                     # does not support functions as parameters
-                    "prep_round_package_endpoints": prep_round.prep_package_endpoints,
+                    "prep_round_package_endpoints": prep_round_package_endpoints,
                     "prep_round": prep_round.name,
                 }
             )
@@ -716,9 +715,7 @@ class Prep(colrev.process.operation.Operation):
         """Sets up the self.prep_package_endpoints"""
         # pylint: disable=redefined-outer-name,invalid-name,global-statement
         global PREP_COUNTER
-        with PREP_COUNTER.get_lock():
-            PREP_COUNTER = Value("i", 0)
-            PREP_COUNTER.value = 0  # type: ignore
+        PREP_COUNTER = itertools.count(1)
 
         self.first_round = bool(i == 0)
 
@@ -952,17 +949,24 @@ class Prep(colrev.process.operation.Operation):
                 if self._nothing_to_prepare_condition(preparation_data):
                     return
 
-                if self._cpu == 1:
-                    # Note: preparation_data is not turned into a list of records.
-                    prepared_records = []
-                    for item in preparation_data:
-                        record = self.prepare(item)
-                        prepared_records.append(record)
-                else:
-                    pool = self._get_prep_pool(prep_round)
-                    prepared_records = pool.map(self.prepare, preparation_data)
-                    pool.close()
-                    pool.join()
+                try:
+                    if self._cpu == 1:
+                        # Note: preparation_data is not turned into a list of records.
+                        prepared_records = []
+                        for item in preparation_data:
+                            record = self.prepare(item)
+                            prepared_records.append(record)
+                    else:
+                        pool = self._get_prep_pool(prep_round)
+                        try:
+                            prepared_records = pool.map(self.prepare, preparation_data)
+                        finally:
+                            # Note : stop pending tasks (if map raised) before flushing
+                            pool.terminate()
+                            pool.join()
+                finally:
+                    # Note : buffered records are stored to resume after interruptions
+                    self._flush_temp_records()
 
                 self._complete_resumed_operation(prepared_records)
 
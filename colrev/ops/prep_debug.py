@@ -157,6 +157,7 @@ class PrepDebug(colrev.ops.prep.Prep):
                     self.review_manager.logger.info(
                         f"Result:\n" f"{self.review_manager.p_printer.pformat(record)}"
                     )
+                self._flush_temp_records()
         except requests_ConnectionError as exc:
             if "OSError(24, 'Too many open files" in str(exc):
                 raise colrev_exceptions.ServiceNotAvailableException(
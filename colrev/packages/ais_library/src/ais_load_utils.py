@@ -5,13 +5,13 @@ from __future__ import annotations
 from colrev.constants import ENTRYTYPES
 from colrev.constants import Fields
 
+AIS_LIBRARY_URL = "https://aisel.aisnet.org/"
+
 
 def enl_id_labeler(records: list) -> None:
     """Labeler for IDs in ENL files."""
     for record_dict in records:
-        record_dict[Fields.ID] = record_dict["U"].replace(
-            "https://aisel.aisnet.org/", ""
-        )
+        record_dict[Fields.ID] = record_dict["U"].removeprefix(AIS_LIBRARY_URL)
 
 
 def enl_entrytype_setter(record_dict: dict) -> None:
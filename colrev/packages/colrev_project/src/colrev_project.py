@@ -104,7 +104,7 @@ class ColrevProjectSearchSource:
 
         # remote_url = project_review_manager.dataset.get_remote_url()
         # if remote_url != "NA":
-        #     project_identifier = remote_url.rstrip(".git")
+        #     project_identifier = remote_url.removesuffix(".git")
 
         project_review_manager.get_load_operation(
             notify_state_transition_operation=False,
@@ -178,7 +178,7 @@ class ColrevProjectSearchSource:
         )
         # pylint: disable=colrev-missed-constant-usage
         project_url = self.search_source.search_parameters["scope"]["url"]
-        project_name = project_url.split("/")[-1].rstrip(".git")
+        project_name = project_url.split("/")[-1].removesuffix(".git")
         records_to_import = self._load_records_to_import(
             project_url=project_url, project_name=project_name
         )
@@ -173,8 +173,7 @@ class DBLPAPI:
 
         self._dblp_json_set_type(item=item)
         if "title" in item:
-            item[Fields.TITLE] = item["title"].rstrip(".").rstrip().replace("\n", " ")
-            item[Fields.TITLE] = re.sub(r"\s+", " ", item[Fields.TITLE])
+            item[Fields.TITLE] = " ".join(item["title"].rstrip(".").split())
         # Note : DBLP provides number-of-pages (instead of pages start-end)
         # if "pages" in item:
         #     item[Fields.PAGES] = item[Fields.PAGES].replace("-", "--")
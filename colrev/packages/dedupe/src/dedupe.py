@@ -57,8 +57,11 @@ class Dedupe:
     def run_dedupe(self) -> None:
         """Run default dedupe"""
 
-        records = self.review_manager.dataset.load_records_dict()
-        records_df = pd.DataFrame.from_dict(records, orient="index")
+        # Note : build the DataFrame directly (without keeping a second
+        # ID-keyed record dict alive)
+        records_df = pd.DataFrame.from_dict(
+            self.review_manager.dataset.load_records_dict(), orient="index"
+        )
         records_df = records_df[
             ~(
                 records_df[Fields.STATUS].isin(
@@ -98,7 +98,8 @@ class EbscoHostSearchSource:
     def _load_bib(self) -> dict:
         def field_mapper(record_dict: dict) -> None:
             for key in list(record_dict.keys()):
-                if key not in ["ID", "ENTRYTYPE"]:
+                # Note : keys that are already lower case are not re-inserted
+                if key not in ["ID", "ENTRYTYPE"] and not key.islower():
                     record_dict[key.lower()] = record_dict.pop(key)
 
         records = colrev.loader.load_utils.load(
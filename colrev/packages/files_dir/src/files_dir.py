@@ -317,20 +317,22 @@ class FilesSearchSource:
                     record.set_text_from_pdf()
                     record_dict = record.get_data()
                     if Fields.TEXT_FROM_PDF in record_dict:
-                        text: str = record_dict[Fields.TEXT_FROM_PDF]
-                        if "bookreview" in text.replace(" ", "").lower():
+                        text: str = (
+                            record_dict[Fields.TEXT_FROM_PDF].replace(" ", "").lower()
+                        )
+                        if "bookreview" in text:
                             record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
                             record_dict["note"] = "Book review"
-                        if "erratum" in text.replace(" ", "").lower():
+                        if "erratum" in text:
                             record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
                             record_dict["note"] = "Erratum"
-                        if "correction" in text.replace(" ", "").lower():
+                        if "correction" in text:
                             record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
                             record_dict["note"] = "Correction"
-                        if "contents" in text.replace(" ", "").lower():
+                        if "contents" in text:
                             record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
                             record_dict["note"] = "Contents"
-                        if "withdrawal" in text.replace(" ", "").lower():
+                        if "withdrawal" in text:
                             record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
                             record_dict["note"] = "Withdrawal"
                         del record_dict[Fields.TEXT_FROM_PDF]
@@ -97,7 +97,7 @@ class JSTORSearchSource:
 
         def id_labeler(records: list) -> None:
             for record_dict in records:
-                record_dict[Fields.ID] = record_dict["UR"].split("/")[-1]
+                record_dict[Fields.ID] = record_dict["UR"].rsplit("/", 1)[-1]
 
         def entrytype_setter(record_dict: dict) -> None:
             if record_dict["TY"] == "JOUR":
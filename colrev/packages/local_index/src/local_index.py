@@ -2,35 +2,40 @@
 """SearchSource: LocalIndex"""
 from __future__ import annotations
 
-import difflib
+import math
+import os
+import threading
 import typing
-import webbrowser
+from copy import deepcopy
+from itertools import chain
 from multiprocessing import Lock
+from multiprocessing.pool import ThreadPool as Pool
 from pathlib import Path
-from urllib.parse import urlparse
 
-import git
 import zope.interface
 from pydantic import Field
 
 import colrev.env.local_index
 import colrev.exceptions as colrev_exceptions
-import colrev.ops.check
 import colrev.package_manager.interfaces
 import colrev.package_manager.package_manager
 import colrev.package_manager.package_settings
 import colrev.record.record
-from colrev.constants import Colors
 from colrev.constants import Fields
 from colrev.constants import FieldSet
 from colrev.constants import FieldValues
 from colrev.constants import RecordState
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
+from colrev.packages.local_index.src import local_index_correction
 
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
 
+# colrev_pdf_ids by (pdf_path, mtime, size)
+_PDF_HASH_CACHE: typing.Dict[typing.Tuple[str, int, int], str] = {}
+_PDF_HASH_CACHE_LOCK = threading.Lock()
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.SearchSourceInterface)
 class LocalIndexSearchSource:
@@ -48,19 +53,38 @@ class LocalIndexSearchSource:
 
     _local_index_md_filename = Path("data/search/md_curated.bib")
 
-    essential_md_keys = [
-        Fields.TITLE,
-        Fields.AUTHOR,
-        Fields.JOURNAL,
-        Fields.YEAR,
-        Fields.BOOKTITLE,
-        Fields.NUMBER,
-        Fields.VOLUME,
-        Fields.AUTHOR,
-        Fields.DOI,
-        Fields.DBLP_KEY,
-        Fields.URL,
-    ]
+    essential_md_keys = frozenset(
+        {
+            Fields.TITLE,
+            Fields.AUTHOR,
+            Fields.JOURNAL,
+            Fields.YEAR,
+            Fields.BOOKTITLE,
+            Fields.NUMBER,
+            Fields.VOLUME,
+            Fields.DOI,
+            Fields.DBLP_KEY,
+            Fields.URL,
+        }
+    )
+
+    # Fields that identify a record in the local-index (in addition to title+author)
+    _identifying_keys = frozenset(
+        {
+            Fields.DOI,
+            Fields.DBLP_KEY,
+            Fields.URL,
+            Fields.PDF_ID,
+            Fields.COLREV_ID,
+            Fields.FILE,
+        }
+    )
+    # Fields that are not imported from records retrieved in API searches
+    _keys_to_drop = frozenset({Fields.STATUS, Fields.ORIGIN, Fields.SCREENING_CRITERIA})
+
+    # Maximum number of retrieval results (hits and misses) kept in memory
+    _RETRIEVAL_CACHE_SIZE = 8192
+    _NR_RETRIEVAL_THREADS = 4
 
     def __init__(
         self,
@@ -98,6 +122,11 @@ class LocalIndexSearchSource:
         self.local_index = colrev.env.local_index.LocalIndex(
             verbose_mode=self.review_manager.verbose_mode
         )
+        self._retrieval_cache: typing.Dict[tuple, typing.Optional[dict]] = {}
+        self._retrieval_cache_lock = threading.Lock()
+        self._prep_feed: typing.Optional[
+            typing.Tuple[int, colrev.ops.search_api_feed.SearchAPIFeed]
+        ] = None
 
     def _validate_source(self) -> None:
         """Validate the SearchSource (parameters etc.)"""
@@ -132,6 +161,46 @@ class LocalIndexSearchSource:
 
         self.review_manager.logger.debug(f"SearchSource {source.filename} validated")
 
+    def _retrieve(self, record_dict: dict) -> colrev.record.record.Record:
+        """Retrieve a record from the local-index (cached for identical records)"""
+
+        # Note : retrieval is based on the (string) fields of the record
+        cache_key = tuple(
+            sorted((k, v) for k, v in record_dict.items() if isinstance(v, str))
+        )
+        # Note : prepare() runs in a ThreadPool (shared cache)
+        with self._retrieval_cache_lock:
+            in_cache = cache_key in self._retrieval_cache
+            if in_cache:
+                # Move to the end (least recently used items are evicted first)
+                cached_record_dict = self._retrieval_cache.pop(cache_key)
+                self._retrieval_cache[cache_key] = cached_record_dict
+        if in_cache:
+            if cached_record_dict is None:
+                raise colrev_exceptions.RecordNotInIndexException(
+                    record_dict.get(Fields.ID, "no-key")
+                )
+            return colrev.record.record.Record(deepcopy(cached_record_dict))
+
+        try:
+            retrieved_record = self.local_index.retrieve(
+                record_dict=record_dict, include_file=False
+            )
+        except colrev_exceptions.RecordNotInIndexException:
+            self._add_to_retrieval_cache(cache_key, None)
+            raise
+        self._add_to_retrieval_cache(cache_key, deepcopy(retrieved_record.data))
+        return retrieved_record
+
+    def _add_to_retrieval_cache(
+        self, cache_key: tuple, record_dict: typing.Optional[dict]
+    ) -> None:
+        with self._retrieval_cache_lock:
+            self._retrieval_cache.pop(cache_key, None)
+            while len(self._retrieval_cache) >= self._RETRIEVAL_CACHE_SIZE:
+                del self._retrieval_cache[next(iter(self._retrieval_cache))]
+            self._retrieval_cache[cache_key] = record_dict
+
     def _retrieve_from_index(self) -> typing.List[dict]:
         params = self.search_source.search_parameters
         query = params["query"]
@@ -141,19 +210,14 @@ class LocalIndexSearchSource:
 
         returned_records = self.local_index.search(query)
 
-        records_to_import = [r.get_data() for r in returned_records]
-        records_to_import = [r for r in records_to_import if r]
-        keys_to_drop = [
-            Fields.STATUS,
-            Fields.ORIGIN,
-            Fields.SCREENING_CRITERIA,
+        records_to_import = [
+            record_dict
+            for record_dict in (r.get_data() for r in returned_records)
+            if record_dict
         ]
         for record_dict in records_to_import:
-            record_dict = {
-                key: value
-                for key, value in record_dict.items()
-                if key not in keys_to_drop
-            }
+            for key in self._keys_to_drop.intersection(record_dict):
+                del record_dict[key]
 
         return records_to_import
 
@@ -163,16 +227,27 @@ class LocalIndexSearchSource:
         local_index_feed: colrev.ops.search_api_feed.SearchAPIFeed,
     ) -> None:
 
-        for feed_record_dict in list(local_index_feed.feed_records.values()):
+        # Retrieve (I/O-bound) in parallel chunks (one index connection per chunk)
+        # and update the feed sequentially (preserving the order of the records)
+        feed_record_dicts = list(local_index_feed.feed_records.values())
+        chunk_size = max(
+            1, math.ceil(len(feed_record_dicts) / self._NR_RETRIEVAL_THREADS)
+        )
+        chunks = [
+            feed_record_dicts[i : i + chunk_size]
+            for i in range(0, len(feed_record_dicts), chunk_size)
+        ]
+        pool = Pool(self._NR_RETRIEVAL_THREADS)
+        retrieved_chunks = pool.map(self.local_index.retrieve_many, chunks)
+        pool.close()
+        pool.join()
+
+        for retrieved_record in chain.from_iterable(retrieved_chunks):
+            if retrieved_record is None:
+                continue
             try:
-                retrieved_record = self.local_index.retrieve(
-                    record_dict=feed_record_dict, include_file=False
-                )
                 local_index_feed.add_update_record(retrieved_record)
-            except (
-                colrev_exceptions.RecordNotInIndexException,
-                colrev_exceptions.NotFeedIdentifiableException,
-            ):
+            except colrev_exceptions.NotFeedIdentifiableException:
                 continue
 
         for record_dict in local_index_feed.records.values():
@@ -188,16 +263,16 @@ class LocalIndexSearchSource:
     ) -> None:
 
         for retrieved_record_dict in self._retrieve_from_index():
-            try:
-                retrieved_record = colrev.record.record.Record(retrieved_record_dict)
-                local_index_feed.add_update_record(retrieved_record)
-            except colrev_exceptions.NotFeedIdentifiableException:
+            # Skip records that are not feed-identifiable
+            # (without raising/catching NotFeedIdentifiableException per record)
+            if self.source_identifier not in retrieved_record_dict:
                 continue
+            retrieved_record = colrev.record.record.Record(retrieved_record_dict)
+            local_index_feed.add_update_record(retrieved_record)
 
-        for record_dict in local_index_feed.feed_records.values():
-            record_dict.pop("colrev.local_index.curation_ID", None)
-            record_dict.pop("curation_ID", None)
-        for record_dict in local_index_feed.records.values():
+        for record_dict in chain(
+            local_index_feed.feed_records.values(), local_index_feed.records.values()
+        ):
             record_dict.pop("colrev.local_index.curation_ID", None)
             record_dict.pop("curation_ID", None)
 
@@ -208,6 +283,10 @@ class LocalIndexSearchSource:
 
         self._validate_source()
 
+        if rerun:
+            with self._retrieval_cache_lock:
+                self._retrieval_cache.clear()
+
         local_index_feed = self.search_source.get_api_feed(
             review_manager=self.review_manager,
             source_identifier=self.source_identifier,
@@ -288,12 +367,12 @@ class LocalIndexSearchSource:
                 field_mapper=field_mapper,
                 logger=self.review_manager.logger,
             )
-            for record_id in records:
-                record_dict = {
-                    k: v
-                    for k, v in records[record_id].items()
-                    if k not in FieldSet.PROVENANCE_KEYS + [Fields.SCREENING_CRITERIA]
-                }
+            keys_to_drop = frozenset(
+                FieldSet.PROVENANCE_KEYS + [Fields.SCREENING_CRITERIA]
+            )
+            for record_dict in records.values():
+                for key in keys_to_drop.intersection(record_dict):
+                    del record_dict[key]
 
                 if Fields.CURATION_ID in record_dict:
                     record_dict[Fields.MD_PROV] = {
@@ -302,7 +381,6 @@ class LocalIndexSearchSource:
                             "note": "",
                         }
                     }
-                records[record_id] = record_dict
 
             return records
 
@@ -315,33 +393,48 @@ class LocalIndexSearchSource:
 
         return record
 
+    def _get_colrev_pdf_id(self, pdf_path: Path) -> str:
+        # PDF hashes are cached (for unchanged files) because hashing is expensive
+        stat = pdf_path.stat()
+        cache_key = (str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        with _PDF_HASH_CACHE_LOCK:
+            if cache_key in _PDF_HASH_CACHE:
+                return _PDF_HASH_CACHE[cache_key]
+        colrev_pdf_id = colrev.record.record.Record.get_colrev_pdf_id(pdf_path)
+        with _PDF_HASH_CACHE_LOCK:
+            _PDF_HASH_CACHE[cache_key] = colrev_pdf_id
+        return colrev_pdf_id
+
     def _add_cpid(self, *, record: colrev.record.record.Record) -> bool:
         # To enable retrieval based on colrev_pdf_id (as part of the global_ids)
-        if Fields.FILE in record.data and "colrev_pdf_id" not in record.data:
-            pdf_path = Path(self.review_manager.path / Path(record.data[Fields.FILE]))
-            if pdf_path.is_file():
-                try:
-                    record.data.update(
-                        colrev_pdf_id=colrev.record.record.Record.get_colrev_pdf_id(
-                            pdf_path,
-                        )
-                    )
-                    return True
-                except colrev_exceptions.PDFHashError:
-                    pass
+        if Fields.FILE not in record.data or Fields.PDF_ID in record.data:
+            return False
+        pdf_path = Path(self.review_manager.path / Path(record.data[Fields.FILE]))
+        if pdf_path.suffix.lower() != ".pdf" or not pdf_path.is_file():
+            return False
+        try:
+            record.data.update(colrev_pdf_id=self._get_colrev_pdf_id(pdf_path))
+            return True
+        except colrev_exceptions.PDFHashError:
+            pass
         return False
 
     def _retrieve_record_from_local_index(
         self,
         record: colrev.record.record.Record,
     ) -> colrev.record.record.Record:
+        # Note : records without identifying fields cannot be retrieved
+        # (skip the PDF hash and the index/toc queries)
+        if not self._identifying_keys.intersection(record.data) and not (
+            Fields.TITLE in record.data and Fields.AUTHOR in record.data
+        ):
+            return record
+
         # add colrev_pdf_id
         added_colrev_pdf_id = self._add_cpid(record=record)
 
         try:
-            retrieved_record = self.local_index.retrieve(
-                record_dict=record.get_data(), include_file=False
-            )
+            retrieved_record = self._retrieve(record.get_data())
         except (
             colrev_exceptions.RecordNotInIndexException,
             colrev_exceptions.NotEnoughDataToIdentifyException,
@@ -379,6 +472,21 @@ class LocalIndexSearchSource:
 
         return retrieved_record
 
+    def _get_prep_feed(self) -> colrev.ops.search_api_feed.SearchAPIFeed:
+        # Note : the feed object is not shared between processes
+        # (load the feed once per process, not once per record)
+        if self._prep_feed is None or self._prep_feed[0] != os.getpid():
+            self._prep_feed = (
+                os.getpid(),
+                self.search_source.get_api_feed(
+                    review_manager=self.review_manager,
+                    source_identifier=self.source_identifier,
+                    update_only=False,
+                    prep_mode=True,
+                ),
+            )
+        return self._prep_feed[1]
+
     def _store_retrieved_record_in_feed(
         self,
         *,
@@ -396,13 +504,7 @@ class LocalIndexSearchSource:
             # lock: to prevent different records from having the same origin
             self.local_index_lock.acquire(timeout=60)
 
-            # Note : need to reload file because the object is not shared between processes
-            local_index_feed = self.search_source.get_api_feed(
-                review_manager=self.review_manager,
-                source_identifier=self.source_identifier,
-                update_only=False,
-                prep_mode=True,
-            )
+            local_index_feed = self._get_prep_feed()
 
             local_index_feed.add_update_record(retrieved_record)
 
@@ -433,15 +535,6 @@ class LocalIndexSearchSource:
             ):
                 record.prescreen_exclude(reason=FieldValues.RETRACTED)
 
-            git_repo = self.review_manager.dataset.get_repo()
-            cur_project_source_paths = [str(self.review_manager.path)]
-            for remote in git_repo.remotes:
-                if remote.url:
-                    shared_url = remote.url
-                    shared_url = shared_url.rstrip(".git")
-                    cur_project_source_paths.append(shared_url)
-                    break
-
             try:
                 local_index_feed.save()
                 # extend fields_to_keep (to retrieve all fields from the index)
@@ -480,424 +573,9 @@ class LocalIndexSearchSource:
 
         return record
 
-    def _get_local_base_repos(self, *, change_itemsets: list) -> dict:
-        base_repos = []
-        for item in change_itemsets:
-            repo_path = colrev.record.record.Record(
-                item["original_record"]
-            ).get_field_provenance_source(FieldValues.CURATED)
-            if repo_path != "":
-                assert "#" not in repo_path
-                # otherwise: strip the ID at the end if we add an ID...
-                base_repos.append(repo_path)
-
-        base_repos = list(set(base_repos))
-        environment_manager = colrev.env.environment_manager.EnvironmentManager()
-        local_base_repos = {
-            x["repo_source_url"]: x["repo_source_path"]
-            for x in environment_manager.local_repos()
-            if x.get("repo_source_url", "NA") in base_repos
-        }
-        return local_base_repos
-
-    def _print_changes(self, *, local_base_repo: str, change_itemsets: list) -> list:
-        def print_diff(change: tuple) -> str:
-            diff = difflib.Differ()
-            letters = list(diff.compare(change[1], change[0]))
-            for i, letter in enumerate(letters):
-                if letter.startswith("  "):
-                    letters[i] = letters[i][-1]
-                elif letter.startswith("+ "):
-                    letters[i] = f"{Colors.RED}" + letters[i][-1] + f"{Colors.END}"
-                elif letter.startswith("- "):
-                    letters[i] = f"{Colors.GREEN}" + letters[i][-1] + f"{Colors.END}"
-            res = "".join(letters).replace("\n", " ")
-            return res
-
-        selected_changes = []
-        print()
-        self.review_manager.logger.info(f"Base repository: {local_base_repo}")
-        for item in change_itemsets:
-            repo_path = colrev.record.record.Record(
-                item["original_record"]
-            ).get_field_provenance_source(FieldValues.CURATED)
-            assert "#" not in repo_path
-
-            if repo_path != local_base_repo:
-                continue
-
-            # self.review_manager.p_printer.pprint(item["original_record"])
-            colrev.record.record.Record(item["original_record"]).print_citation_format()
-            for change_item in item["changes"]:
-                if change_item[0] == "change":
-                    edit_type, field, values = change_item
-                    if field == "colrev_id":
-                        continue
-                    prefix = f"{edit_type} {field}"
-                    print(
-                        f"{prefix}"
-                        + " " * max(len(prefix), 30 - len(prefix))
-                        + f": {values[0]}"
-                    )
-                    print(
-                        " " * max(len(prefix), 30)
-                        + f"  {Colors.ORANGE}{values[1]}{Colors.END}"
-                    )
-                    print(
-                        " " * max(len(prefix), 30)
-                        + f"  {print_diff((values[0], values[1]))}"
-                    )
-
-                elif change_item[0] == "add":
-                    edit_type, field, values = change_item
-                    prefix = f"{edit_type} {values[0][0]}"
-                    print(
-                        prefix
-                        + " " * max(len(prefix), 30 - len(prefix))
-                        + f": {Colors.GREEN}{values[0][1]}{Colors.END}"
-                    )
-                else:
-                    self.review_manager.p_printer.pprint(change_item)
-            selected_changes.append(item)
-        return selected_changes
-
     def apply_correction(self, *, change_itemsets: list) -> None:
         """Apply a correction by opening a pull request in the original repository"""
 
-        local_base_repos = self._get_local_base_repos(change_itemsets=change_itemsets)
-
-        for local_base_repo_url, local_base_repo_path in local_base_repos.items():
-            selected_changes = self._print_changes(
-                local_base_repo=local_base_repo_url, change_itemsets=change_itemsets
-            )
-
-            response = ""
-            while True:
-                response = input("\nConfirm changes? (y/n)")
-                if response in ["y", "n"]:
-                    break
-
-            if response == "y":
-                self._apply_correction(
-                    source_url=local_base_repo_path,
-                    change_list=selected_changes,
-                )
-            elif response == "n":
-                if input("Discard all corrections (y/n)?") == "y":
-                    for selected_change in selected_changes:
-                        Path(selected_change[Fields.FILE]).unlink()
-
-    def _apply_corrections_precondition(
-        self, *, check_operation: colrev.process.operation.Operation, source_url: str
-    ) -> bool:
-        git_repo = check_operation.review_manager.dataset.get_repo()
-
-        if git_repo.is_dirty():
-            msg = f"Repo not clean ({source_url}): commit or stash before updating records"
-            raise colrev_exceptions.CorrectionPreconditionException(msg)
-
-        if check_operation.review_manager.dataset.behind_remote():
-            origin = git_repo.remotes.origin
-            origin.pull()
-            if not check_operation.review_manager.dataset.behind_remote():
-                self.review_manager.logger.info("Pulled changes")
-            else:
-                self.review_manager.logger.error(
-                    "Repo behind remote. Pull first to avoid conflicts.\n"
-                    "colrev env --pull"
-                )
-                return False
-
-        return True
-
-    def _retrieve_by_colrev_id(
-        self, *, indexed_record_dict: dict, records: list[dict]
-    ) -> dict:
-        indexed_record = colrev.record.record.Record(indexed_record_dict)
-
-        # if "colrev_id" in indexed_record.data:
-        #     cid_to_retrieve = indexed_record.get_colrev_id()
-        # else:
-        #     cid_to_retrieve = [indexed_record.get_colrev_id()]
-        cid_to_retrieve = [indexed_record.get_colrev_id()]
-
-        record_l = [
-            x
-            for x in records
-            if any(
-                cid in colrev.record.record.Record(x).get_colrev_id()
-                for cid in cid_to_retrieve
-            )
-        ]
-        if len(record_l) != 1:
-            raise colrev_exceptions.RecordNotInRepoException(
-                indexed_record.data[Fields.ID]
-            )
-        return record_l[0]
-
-    def _retrieve_record_for_correction(
-        self,
-        *,
-        records: dict,
-        change_item: dict,
-    ) -> dict:
-        original_record = change_item["original_record"]
-
-        local_index_feed = self.search_source.get_api_feed(
-            review_manager=self.review_manager,
-            source_identifier=self.source_identifier,
-            update_only=True,
-        )
-
-        try:
-            md_curated_origin_id = [
-                x for x in original_record[Fields.ORIGIN] if "md_curated.bib/" in x
-            ][0].replace("md_curated.bib/", "")
-            curation_origin_record = local_index_feed.feed_records[md_curated_origin_id]
-            curation_id = curation_origin_record[Fields.CURATION_ID]
-            curation_id = curation_id[curation_id.find("#") + 1 :]
-            return records[curation_id]
-        except KeyError:
-            pass
-
-        try:
-            record_dict = self._retrieve_by_colrev_id(
-                indexed_record_dict=original_record,
-                records=list(records.values()),
-            )
-            return record_dict
-        except colrev_exceptions.RecordNotInRepoException:
-            matching_doi_rec_l = [
-                r
-                for r in records.values()
-                if original_record.get(Fields.DOI, "NDOI") == r.get(Fields.DOI, "NA")
-            ]
-            if len(matching_doi_rec_l) == 1:
-                record_dict = matching_doi_rec_l[0]
-                return record_dict
-
-            matching_url_rec_l = [
-                r
-                for r in records.values()
-                if original_record.get(Fields.URL, "NURL") == r.get(Fields.URL, "NA")
-            ]
-            if len(matching_url_rec_l) == 1:
-                record_dict = matching_url_rec_l[0]
-                return record_dict
-
-        self.review_manager.logger.error(
-            f"{Colors.RED}Record not found: {original_record[Fields.ID]}{Colors.END}"
-        )
-        raise colrev_exceptions.RecordNotInIndexException(original_record[Fields.ID])
-
-    def _create_correction_branch(
-        self, *, git_repo: git.Repo, record_dict: dict
-    ) -> str:
-        record_branch_name = record_dict[Fields.ID]
-        counter = 1
-        new_record_branch_name = record_branch_name
-        while new_record_branch_name in [ref.name for ref in git_repo.references]:
-            new_record_branch_name = f"{record_branch_name}_{counter}"
-            counter += 1
-
-        record_branch_name = new_record_branch_name
-        git_repo.git.branch(record_branch_name)
-        return record_branch_name
-
-    def _apply_record_correction(
-        self,
-        *,
-        check_operation: colrev.process.operation.Operation,
-        records: dict,
-        record_dict: dict,
-        change_item: dict,
-    ) -> None:
-        for edit_type, key, change in list(change_item["changes"]):
-            # Note : by retricting changes to self.essential_md_keys,
-            # we also prevent changes in
-            # Fields.STATUS, Fields.ORIGIN, Fields.FILE
-
-            # Note: the most important thing is to update the metadata.
-
-            if edit_type == "change":
-                if key not in self.essential_md_keys:
-                    continue
-                record_dict[key] = change[1]
-            if edit_type == "add":
-                key = change[0][0]
-                value = change[0][1]
-                if key not in self.essential_md_keys:
-                    continue
-                record_dict[key] = value
-            # gh_issue https://github.com/CoLRev-Environment/colrev/issues/63
-            # deal with remove/merge
-
-        check_operation.review_manager.dataset.save_records_dict(records)
-        check_operation.review_manager.dataset.create_commit(
-            msg=f"Update {record_dict['ID']}", script_call="colrev push"
-        )
-
-    def _push_corrections_and_reset_branch(
-        self,
-        *,
-        git_repo: git.Repo,
-        record_branch_name: str,
-        prev_branch_name: str,
-        source_url: str,
-    ) -> None:
-        git_repo.remotes.origin.push(
-            refspec=f"{record_branch_name}:{record_branch_name}"
-        )
-        self.review_manager.logger.info("Pushed corrections")
-
-        for head in git_repo.heads:
-            if head.name == prev_branch_name:
-                head.checkout()
-
-        git_repo = git.Git(source_url)
-        git_repo.execute(["git", "branch", "-D", record_branch_name])
-
-        self.review_manager.logger.info("Removed local corrections branch")
-
-    def _reset_record_after_correction(
-        self, *, record_dict: dict, rec_for_reset: dict, change_item: dict
-    ) -> None:
-        # reset the record - each branch should have changes for one record
-        # Note : modify dict (do not replace it) - otherwise changes will not be
-        # part of the records.
-        for key, value in rec_for_reset.items():
-            record_dict[key] = value
-        keys_added = [
-            key for key in record_dict.keys() if key not in rec_for_reset.keys()
-        ]
-        for key in keys_added:
-            del record_dict[key]
-
-        if Path(change_item[Fields.FILE]).is_file():
-            Path(change_item[Fields.FILE]).unlink()
-
-    def _apply_change_item_correction(
-        self,
-        *,
-        check_operation: colrev.process.operation.Operation,
-        source_url: str,
-        change_list: list,
-    ) -> bool:
-        # pylint: disable=too-many-locals
-
-        git_repo = check_operation.review_manager.dataset.get_repo()
-        records = check_operation.review_manager.dataset.load_records_dict()
-
-        success = False
-        pull_request_msgs = []
-        pull_request_links = []
-        for change_item in change_list:
-            try:
-                record_dict = self._retrieve_record_for_correction(
-                    records=records,
-                    change_item=change_item,
-                )
-                if not record_dict:
-                    continue
-
-                record_branch_name = self._create_correction_branch(
-                    git_repo=git_repo, record_dict=record_dict
-                )
-                prev_branch_name = git_repo.active_branch.name
-
-                remote = git_repo.remote()
-                for head in git_repo.heads:
-                    if head.name == record_branch_name:
-                        head.checkout()
-
-                rec_for_reset = record_dict.copy()
-
-                self._apply_record_correction(
-                    check_operation=check_operation,
-                    records=records,
-                    record_dict=record_dict,
-                    change_item=change_item,
-                )
-
-                self._push_corrections_and_reset_branch(
-                    git_repo=git_repo,
-                    record_branch_name=record_branch_name,
-                    prev_branch_name=prev_branch_name,
-                    source_url=source_url,
-                )
-
-                self._reset_record_after_correction(
-                    record_dict=record_dict,
-                    rec_for_reset=rec_for_reset,
-                    change_item=change_item,
-                )
-
-                host = urlparse(remote.url).hostname
-                if host and host.endswith("github.com"):
-                    link = (
-                        str(remote.url).rstrip(".git")
-                        + "/compare/"
-                        + record_branch_name
-                    )
-                    pull_request_links.append(link)
-                    pull_request_msgs.append(
-                        "\nTo create a pull request for your changes go "
-                        f"to \n{Colors.ORANGE}{link}{Colors.END}"
-                    )
-                success = True
-            except colrev_exceptions.RecordNotInIndexException:
-                pass
-
-        for pull_request_msg in pull_request_msgs:
-            print(pull_request_msg)
-        for pull_request_link in pull_request_links:
-            webbrowser.open(pull_request_link, new=2)
-
-        # https://github.com/geritwagner/information_systems_papers/compare/update?expand=1
-        # gh_issue https://github.com/CoLRev-Environment/colrev/issues/63
-        # handle cases where update branch already exists
-        return success
-
-    def _apply_correction(self, *, source_url: str, change_list: list) -> None:
-        """Apply a (list of) corrections"""
-
-        # TBD: other modes of accepting changes?
-        # e.g., only-metadata, no-changes, all(including optional fields)
-        check_review_manager = self.review_manager.get_connecting_review_manager(
-            path_str=source_url
-        )
-        check_operation = colrev.ops.check.CheckOperation(check_review_manager)
-
-        if check_review_manager.dataset.behind_remote():
-            git_repo = check_review_manager.dataset.get_repo()
-            origin = git_repo.remotes.origin
-            self.review_manager.logger.info(
-                f"Pull project changes from {git_repo.remotes.origin}"
-            )
-            res = origin.pull()
-            self.review_manager.logger.info(res)
-
-        try:
-            if not self._apply_corrections_precondition(
-                check_operation=check_operation, source_url=source_url
-            ):
-                return
-        except colrev_exceptions.CorrectionPreconditionException as exc:
-            print(exc)
-            return
-
-        check_review_manager.logger.info(
-            "Precondition for correction (pull-request) checked."
-        )
-
-        success = self._apply_change_item_correction(
-            check_operation=check_operation,
-            source_url=source_url,
-            change_list=change_list,
-        )
-
-        if success:
-            print(
-                f"\n{Colors.GREEN}Thank you for supporting other researchers "
-                f"by sharing your corrections ❤{Colors.END}\n"
-            )
+        local_index_correction.LocalIndexCorrection(
+            local_index_source=self
+        ).apply_correction(change_itemsets=change_itemsets)
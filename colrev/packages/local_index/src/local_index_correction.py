@@ -0,0 +1,470 @@
+#! /usr/bin/env python
+"""Correction of curated records (pull requests) based on LocalIndex"""
+from __future__ import annotations
+
+import difflib
+import typing
+import webbrowser
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlparse
+
+import git
+
+import colrev.env.environment_manager
+import colrev.exceptions as colrev_exceptions
+import colrev.ops.check
+import colrev.record.record
+from colrev.constants import Colors
+from colrev.constants import Fields
+from colrev.constants import FieldValues
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import colrev.packages.local_index.src.local_index as local_index_connector
+
+
+# pylint: disable=too-few-public-methods
+
+
+class LocalIndexCorrection:
+    """Apply corrections to curated repositories (linked in the LocalIndex)"""
+
+    _md_curated_origin_prefix = "md_curated.bib/"
+
+    def __init__(
+        self, *, local_index_source: local_index_connector.LocalIndexSearchSource
+    ) -> None:
+        self.local_index_source = local_index_source
+        self.review_manager = local_index_source.review_manager
+
+    def _get_change_itemsets_by_repo(self, *, change_itemsets: list) -> dict:
+        # Determine the curated (base) repository once per change item
+        change_itemsets_by_repo: typing.Dict[str, list] = defaultdict(list)
+        for item in change_itemsets:
+            repo_path = colrev.record.record.Record(
+                item["original_record"]
+            ).get_field_provenance_source(FieldValues.CURATED)
+            assert "#" not in repo_path
+            # otherwise: strip the ID at the end if we add an ID...
+            change_itemsets_by_repo[repo_path].append(item)
+        return change_itemsets_by_repo
+
+    def _get_local_base_repos(self, *, change_itemsets_by_repo: dict) -> dict:
+        base_repos = {repo_path for repo_path in change_itemsets_by_repo if repo_path}
+        environment_manager = colrev.env.environment_manager.EnvironmentManager()
+        local_base_repos = {
+            x["repo_source_url"]: x["repo_source_path"]
+            for x in environment_manager.local_repos()
+            if x.get("repo_source_url", "NA") in base_repos
+        }
+        return local_base_repos
+
+    def _print_changes(self, *, local_base_repo: str, change_itemsets: list) -> list:
+        def print_diff(change: tuple) -> str:
+            # Span-level operations (instead of a character-by-character diff):
+            # removed parts (of change[1]) in green, added parts (of change[0]) in red
+            sequence_matcher = difflib.SequenceMatcher(
+                a=change[1], b=change[0], autojunk=False
+            )
+            parts = []
+            for tag, i1, i2, j1, j2 in sequence_matcher.get_opcodes():
+                if tag == "equal":
+                    parts.append(change[1][i1:i2])
+                    continue
+                if tag in ["delete", "replace"]:
+                    parts.append(f"{Colors.GREEN}{change[1][i1:i2]}{Colors.END}")
+                if tag in ["insert", "replace"]:
+                    parts.append(f"{Colors.RED}{change[0][j1:j2]}{Colors.END}")
+            res = "".join(parts).replace("\n", " ")
+            return res
+
+        selected_changes = []
+        print()
+        self.review_manager.logger.info(f"Base repository: {local_base_repo}")
+        for item in change_itemsets:
+            # self.review_manager.p_printer.pprint(item["original_record"])
+            colrev.record.record.Record(item["original_record"]).print_citation_format()
+            for change_item in item["changes"]:
+                if change_item[0] == "change":
+                    edit_type, field, values = change_item
+                    if field == "colrev_id":
+                        continue
+                    prefix = f"{edit_type} {field}"
+                    prefix_padding = " " * max(len(prefix), 30 - len(prefix))
+                    padding = " " * max(len(prefix), 30)
+                    print(
+                        f"{prefix}{prefix_padding}: {values[0]}\n"
+                        f"{padding}  {Colors.ORANGE}{values[1]}{Colors.END}\n"
+                        f"{padding}  {print_diff((values[0], values[1]))}"
+                    )
+
+                elif change_item[0] == "add":
+                    edit_type, field, values = change_item
+                    prefix = f"{edit_type} {values[0][0]}"
+                    prefix_padding = " " * max(len(prefix), 30 - len(prefix))
+                    print(
+                        f"{prefix}{prefix_padding}: "
+                        f"{Colors.GREEN}{values[0][1]}{Colors.END}"
+                    )
+                else:
+                    self.review_manager.p_printer.pprint(change_item)
+            selected_changes.append(item)
+        return selected_changes
+
+    def apply_correction(self, *, change_itemsets: list) -> None:
+        """Apply a correction by opening a pull request in the original repository"""
+
+        change_itemsets_by_repo = self._get_change_itemsets_by_repo(
+            change_itemsets=change_itemsets
+        )
+        local_base_repos = self._get_local_base_repos(
+            change_itemsets_by_repo=change_itemsets_by_repo
+        )
+
+        for local_base_repo_url, local_base_repo_path in local_base_repos.items():
+            selected_changes = self._print_changes(
+                local_base_repo=local_base_repo_url,
+                change_itemsets=change_itemsets_by_repo[local_base_repo_url],
+            )
+
+            response = ""
+            while True:
+                response = input("\nConfirm changes? (y/n)")
+                if response in ["y", "n"]:
+                    break
+
+            if response == "y":
+                self._apply_correction(
+                    source_url=local_base_repo_path,
+                    change_list=selected_changes,
+                )
+            elif response == "n":
+                if input("Discard all corrections (y/n)?") == "y":
+                    for selected_change in selected_changes:
+                        Path(selected_change[Fields.FILE]).unlink()
+
+    def _apply_corrections_precondition(
+        self, *, check_operation: colrev.process.operation.Operation, source_url: str
+    ) -> bool:
+        git_repo = check_operation.review_manager.dataset.get_repo()
+
+        if git_repo.is_dirty():
+            msg = f"Repo not clean ({source_url}): commit or stash before updating records"
+            raise colrev_exceptions.CorrectionPreconditionException(msg)
+
+        if check_operation.review_manager.dataset.behind_remote():
+            origin = git_repo.remotes.origin
+            self.review_manager.logger.info(f"Pull project changes from {origin}")
+            origin.pull()
+            if not check_operation.review_manager.dataset.behind_remote():
+                self.review_manager.logger.info("Pulled changes")
+            else:
+                self.review_manager.logger.error(
+                    "Repo behind remote. Pull first to avoid conflicts.\n"
+                    "colrev env --pull"
+                )
+                return False
+
+        return True
+
+    def _get_record_index(self, *, records: dict) -> dict:
+        """Index the records by colrev_id, doi, and url
+        (to retrieve the records corresponding to the change items)"""
+        record_index: dict = {
+            Fields.COLREV_ID: defaultdict(list),
+            Fields.DOI: defaultdict(list),
+            Fields.URL: defaultdict(list),
+        }
+        for record_dict in records.values():
+            try:
+                colrev_id = colrev.record.record.Record(record_dict).get_colrev_id()
+                record_index[Fields.COLREV_ID][colrev_id].append(record_dict)
+            except colrev_exceptions.NotEnoughDataToIdentifyException:
+                pass
+            for key in [Fields.DOI, Fields.URL]:
+                if key in record_dict:
+                    record_index[key][record_dict[key]].append(record_dict)
+        return record_index
+
+    def _retrieve_by_colrev_id(
+        self, *, indexed_record_dict: dict, record_index: dict
+    ) -> dict:
+        indexed_record = colrev.record.record.Record(indexed_record_dict)
+        cid_to_retrieve = indexed_record.get_colrev_id()
+
+        record_l = record_index[Fields.COLREV_ID].get(cid_to_retrieve, [])
+        if len(record_l) != 1:
+            raise colrev_exceptions.RecordNotInRepoException(
+                indexed_record.data[Fields.ID]
+            )
+        return record_l[0]
+
+    def _retrieve_record_for_correction(
+        self,
+        *,
+        records: dict,
+        get_record_index: typing.Callable[[], dict],
+        feed_records: dict,
+        change_item: dict,
+    ) -> dict:
+        original_record = change_item["original_record"]
+
+        md_curated_origin_id = next(
+            (
+                origin.removeprefix(self._md_curated_origin_prefix)
+                for origin in original_record.get(Fields.ORIGIN, [])
+                if origin.startswith(self._md_curated_origin_prefix)
+            ),
+            None,
+        )
+        if md_curated_origin_id is not None:
+            curation_origin_record = feed_records.get(md_curated_origin_id, {})
+            curation_id = curation_origin_record.get(Fields.CURATION_ID, "")
+            curation_id = curation_id[curation_id.find("#") + 1 :]
+            if curation_id in records:
+                return records[curation_id]
+
+        # Note : the record index is only created when the md_curated origin
+        # does not identify the record (computing all colrev_ids is expensive)
+        record_index = get_record_index()
+
+        try:
+            record_dict = self._retrieve_by_colrev_id(
+                indexed_record_dict=original_record,
+                record_index=record_index,
+            )
+            return record_dict
+        except colrev_exceptions.RecordNotInRepoException:
+            for key in [Fields.DOI, Fields.URL]:
+                if key not in original_record:
+                    continue
+                matching_rec_l = record_index[key].get(original_record[key], [])
+                if len(matching_rec_l) == 1:
+                    record_dict = matching_rec_l[0]
+                    return record_dict
+
+        self.review_manager.logger.error(
+            f"{Colors.RED}Record not found: {original_record[Fields.ID]}{Colors.END}"
+        )
+        raise colrev_exceptions.RecordNotInIndexException(original_record[Fields.ID])
+
+    def _create_correction_branch(
+        self, *, git_repo: git.Repo, record_dict: dict
+    ) -> str:
+        record_branch_name = record_dict[Fields.ID]
+        counter = 1
+        new_record_branch_name = record_branch_name
+        existing_ref_names = {ref.name for ref in git_repo.references}
+        while new_record_branch_name in existing_ref_names:
+            new_record_branch_name = f"{record_branch_name}_{counter}"
+            counter += 1
+
+        record_branch_name = new_record_branch_name
+        git_repo.create_head(record_branch_name)
+        return record_branch_name
+
+    def _apply_record_correction(
+        self,
+        *,
+        check_operation: colrev.process.operation.Operation,
+        records: dict,
+        record_dict: dict,
+        change_items: list,
+    ) -> None:
+        changes = [change for item in change_items for change in item["changes"]]
+        for edit_type, key, change in changes:
+            # Note : by retricting changes to self.local_index_source.essential_md_keys,
+            # we also prevent changes in
+            # Fields.STATUS, Fields.ORIGIN, Fields.FILE
+
+            # Note: the most important thing is to update the metadata.
+
+            if edit_type == "change":
+                if key not in self.local_index_source.essential_md_keys:
+                    continue
+                record_dict[key] = change[1]
+            if edit_type == "add":
+                key = change[0][0]
+                value = change[0][1]
+                if key not in self.local_index_source.essential_md_keys:
+                    continue
+                record_dict[key] = value
+            # gh_issue https://github.com/CoLRev-Environment/colrev/issues/63
+            # deal with remove/merge
+
+        check_operation.review_manager.dataset.save_records_dict(records)
+        check_operation.review_manager.dataset.create_commit(
+            msg=f"Update {record_dict['ID']}", script_call="colrev push"
+        )
+
+    def _push_corrections_and_reset_branch(
+        self,
+        *,
+        git_repo: git.Repo,
+        record_branch_name: str,
+        prev_branch_name: str,
+    ) -> None:
+        git_repo.remotes.origin.push(
+            refspec=f"{record_branch_name}:{record_branch_name}"
+        )
+        self.review_manager.logger.info("Pushed corrections")
+
+        git_repo.heads[prev_branch_name].checkout()
+
+        git_repo.delete_head(record_branch_name, force=True)
+
+        self.review_manager.logger.info("Removed local corrections branch")
+
+    def _reset_record_after_correction(
+        self, *, record_dict: dict, rec_for_reset: dict, change_items: list
+    ) -> None:
+        # reset the record (after the corrections were pushed)
+        # Note : modify dict (do not replace it) - otherwise changes will not be
+        # part of the records.
+        for key, value in rec_for_reset.items():
+            record_dict[key] = value
+        keys_added = [
+            key for key in record_dict.keys() if key not in rec_for_reset.keys()
+        ]
+        for key in keys_added:
+            del record_dict[key]
+
+        for change_item in change_items:
+            if Path(change_item[Fields.FILE]).is_file():
+                Path(change_item[Fields.FILE]).unlink()
+
+    def _apply_change_item_correction(
+        self,
+        *,
+        check_operation: colrev.process.operation.Operation,
+        change_list: list,
+    ) -> bool:
+        # pylint: disable=too-many-locals
+
+        if not change_list:
+            return False
+
+        git_repo = check_operation.review_manager.dataset.get_repo()
+        records = check_operation.review_manager.dataset.load_records_dict()
+        record_index: typing.Optional[dict] = None
+
+        def get_record_index() -> dict:
+            nonlocal record_index
+            if record_index is None:
+                record_index = self._get_record_index(records=records)
+            return record_index
+
+        # Note : the feed is loaded once (not for each change item)
+        # and the main records (of this project) are not needed (prep_mode)
+        local_index_feed = self.local_index_source.search_source.get_api_feed(
+            review_manager=self.review_manager,
+            source_identifier=self.local_index_source.source_identifier,
+            update_only=True,
+            prep_mode=True,
+        )
+
+        # Group the change items by record (ID)
+        change_items_by_record: typing.Dict[str, typing.Tuple[dict, list]] = {}
+        for change_item in change_list:
+            try:
+                record_dict = self._retrieve_record_for_correction(
+                    records=records,
+                    get_record_index=get_record_index,
+                    feed_records=local_index_feed.feed_records,
+                    change_item=change_item,
+                )
+            except colrev_exceptions.RecordNotInIndexException:
+                continue
+            if not record_dict:
+                continue
+            if record_dict[Fields.ID] not in change_items_by_record:
+                change_items_by_record[record_dict[Fields.ID]] = (record_dict, [])
+            change_items_by_record[record_dict[Fields.ID]][1].append(change_item)
+
+        if not change_items_by_record:
+            return False
+
+        # Note : the corrections are committed to one branch (one commit per
+        # record), which is pushed once (instead of one branch per record)
+        prev_branch_name = git_repo.active_branch.name
+        first_record_dict = next(iter(change_items_by_record.values()))[0]
+        record_branch_name = self._create_correction_branch(
+            git_repo=git_repo, record_dict=first_record_dict
+        )
+        git_repo.heads[record_branch_name].checkout()
+
+        corrections_for_reset = []
+        for record_dict, change_items in change_items_by_record.values():
+            corrections_for_reset.append(
+                (record_dict, record_dict.copy(), change_items)
+            )
+            self._apply_record_correction(
+                check_operation=check_operation,
+                records=records,
+                record_dict=record_dict,
+                change_items=change_items,
+            )
+
+        self._push_corrections_and_reset_branch(
+            git_repo=git_repo,
+            record_branch_name=record_branch_name,
+            prev_branch_name=prev_branch_name,
+        )
+
+        for record_dict, rec_for_reset, change_items in corrections_for_reset:
+            self._reset_record_after_correction(
+                record_dict=record_dict,
+                rec_for_reset=rec_for_reset,
+                change_items=change_items,
+            )
+
+        remote_url = str(git_repo.remote().url)
+        host = urlparse(remote_url).hostname
+        if host and host.endswith("github.com"):
+            link = f"{remote_url.removesuffix('.git')}/compare/{record_branch_name}"
+            print(
+                "\nTo create a pull request for your changes go "
+                f"to \n{Colors.ORANGE}{link}{Colors.END}"
+            )
+            webbrowser.open(link, new=2)
+
+        # https://github.com/geritwagner/information_systems_papers/compare/update?expand=1
+        # gh_issue https://github.com/CoLRev-Environment/colrev/issues/63
+        # handle cases where update branch already exists
+        return True
+
+    def _apply_correction(self, *, source_url: str, change_list: list) -> None:
+        """Apply a (list of) corrections"""
+
+        # TBD: other modes of accepting changes?
+        # e.g., only-metadata, no-changes, all(including optional fields)
+        check_review_manager = self.review_manager.get_connecting_review_manager(
+            path_str=source_url
+        )
+        check_operation = colrev.ops.check.CheckOperation(check_review_manager)
+
+        # Note : the precondition checks whether the repo is behind the remote
+        # (and pulls the changes), i.e., the remote is fetched once (not twice)
+        try:
+            if not self._apply_corrections_precondition(
+                check_operation=check_operation, source_url=source_url
+            ):
+                return
+        except colrev_exceptions.CorrectionPreconditionException as exc:
+            print(exc)
+            return
+
+        check_review_manager.logger.info(
+            "Precondition for correction (pull-request) checked."
+        )
+
+        success = self._apply_change_item_correction(
+            check_operation=check_operation,
+            change_list=change_list,
+        )
+
+        if success:
+            print(
+                f"\n{Colors.GREEN}Thank you for supporting other researchers "
+                f"by sharing your corrections ❤{Colors.END}\n"
+            )
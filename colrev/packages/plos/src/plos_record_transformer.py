@@ -166,10 +166,11 @@ def _format_fields(*, record_dict: dict) -> dict:
             continue
         value = value.replace("<scp>", "{")
         value = value.replace("</scp>", "}")
-        value = html.unescape(value)
-        value = re.sub(TAG_RE, " ", value)
-        value = value.replace("\n", " ")
-        value = re.sub(r"\s+", " ", value).rstrip().lstrip("▪ ")
+        if "&" in value:
+            value = html.unescape(value)
+        if "<" in value:
+            value = TAG_RE.sub(" ", value)
+        value = " ".join(value.split()).lstrip("▪ ")
 
         if key == Fields.ABSTRACT:
 
@@ -29,11 +29,13 @@ from colrev.constants import Fields
 from colrev.constants import SearchSourceHeuristicStatus
 from colrev.constants import SearchType
 from colrev.packages.semanticscholar.src import record_transformer
-from colrev.packages.semanticscholar.src.semanticscholar_ui import SemanticScholarUI
 
 if typing.TYPE_CHECKING:  # pragma: no cover
 
     import colrev.ops.prep
+    from colrev.packages.semanticscholar.src.semanticscholar_ui import (
+        SemanticScholarUI,
+    )
 
 
 # pylint: disable=unused-argument
@@ -67,7 +69,6 @@ class SemanticScholarSearchSource:
         f"https://status.api.semanticscholar.org/{Colors.END})"
     )
 
-    _s2_UI = SemanticScholarUI()
     _s2_filename = Path("data/search/md_semscholar.bib")
 
     def __init__(
@@ -249,16 +250,28 @@ class SemanticScholarSearchSource:
             )
         return record_return
 
+    @staticmethod
+    def _get_s2_ui() -> SemanticScholarUI:
+        """Get the (inquirer-based) console UI"""
+        # Note : the UI (and inquirer) is only imported for interactive use
+        # pylint: disable=import-outside-toplevel
+        from colrev.packages.semanticscholar.src.semanticscholar_ui import (
+            SemanticScholarUI,
+        )
+
+        return SemanticScholarUI()
+
     def _get_api_key(self) -> str:
         """Method to request an API key from the settings file - or, if empty, from user input"""
         api_key = self.review_manager.environment_manager.get_settings_by_key(
             self.SETTINGS["api_key"]
         )
 
+        s2_ui = self._get_s2_ui()
         if api_key:
-            api_key = self._s2_UI.get_api_key(api_key)
+            api_key = s2_ui.get_api_key(api_key)
         else:
-            api_key = self._s2_UI.get_api_key()
+            api_key = s2_ui.get_api_key()
 
         if api_key:
             self.review_manager.environment_manager.update_registry(
@@ -335,9 +348,10 @@ class SemanticScholarSearchSource:
         """Add SearchSource as an endpoint (based on query provided to colrev search --add )"""
 
         # get search parameters from the user interface
-        cls._s2_UI.main_ui()
-        search_subject = cls._s2_UI.search_subject
-        search_params = cls._s2_UI.search_params
+        s2_ui = cls._get_s2_ui()
+        s2_ui.main_ui()
+        search_subject = s2_ui.search_subject
+        search_params = s2_ui.search_params
 
         search_params["search_subject"] = search_subject
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 """Console UI for Semantic Scholar"""
 import datetime
+import functools
 import re
 import typing
 
@@ -9,6 +10,74 @@ import inquirer
 import colrev.exceptions as colrev_exceptions
 from colrev.constants import Fields
 
+# pylint: disable=unused-argument
+
+S2_ID_RE = re.compile(r"^[a-zA-Z0-9]+$")
+DOI_RE = re.compile(r"^10\..+$")
+ARXIV_ID_RE = re.compile(r"^\d+\.\d+$")
+ACL_ID_RE = re.compile(r"^\w+-\w+$")
+NUMERIC_ID_RE = re.compile(r"^[0-9]+$")
+API_KEY_RE = re.compile(r"^\w{40}$")
+YEAR_SPAN_RE = re.compile(r"^(?:-\d{4}|\d{4}-?|\d{4}-\d{4})$")
+YEAR_RANGE_RE = re.compile(r"^\d{4}-\d{4}$")
+OPEN_YEAR_SPAN_RE = re.compile(r"^-?\d{4}-?$")
+YEAR_RE = re.compile(r"\d{4}")
+MAIN_OPTIONS = (
+    "Keyword search",
+    "Search for paper by ID",
+    "Search for author by ID",
+    "Exit Program",
+)
+PAPER_ID_OPTIONS = (
+    "S2PaperId",
+    "CorpusId",
+    "DOI",
+    "ArXivId",
+    "MAG",
+    "ACL",
+    "PMID",
+    "PMCID",
+)
+PAPER_ID_OPTIONS_SET = frozenset(PAPER_ID_OPTIONS)
+STUDY_FIELDS = (
+    "Computer Science",
+    "Medicine",
+    "Chemistry",
+    "Biology",
+    "Materials Science",
+    "Physics",
+    "Geology",
+    "Psychology",
+    "Art",
+    "History",
+    "Geography",
+    "Sociology",
+    "Business",
+    "Political Science",
+    "Economics",
+    "Philosophy",
+    "Mathematics",
+    "Engineering",
+    "Environmental Science",
+    "Agricultural and Food Sciences",
+    "Education",
+    "Law",
+    "Linguistics",
+)
+# Paper IDs that are not listed are numeric (CorpusId, MAG, PMID, PMCID)
+PAPER_ID_FORMATS = {
+    "S2PaperId": S2_ID_RE,
+    "DOI": DOI_RE,
+    "ArXivId": ARXIV_ID_RE,
+    "ACL": ACL_ID_RE,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _matches(regex: re.Pattern, value: str) -> bool:
+    # Note : compiled patterns are hashable (values are often re-entered)
+    return regex.match(value) is not None
+
 
 class SemanticScholarUI:
     """Implements the User Interface for the SemanticScholar API Search within colrev"""
@@ -27,14 +96,7 @@ class SemanticScholarUI:
         print("\nWelcome to SemanticScholar! \n\n")
         while run:
             main_msg = "Please choose one of the options below "
-            main_options = [
-                "Keyword search",
-                "Search for paper by ID",
-                "Search for author by ID",
-                "Exit Program",
-            ]
-
-            fwd_value = self.choose_single_option(msg=main_msg, options=main_options)
+            fwd_value = self.choose_single_option(msg=main_msg, options=MAIN_OPTIONS)
 
             if fwd_value == "Search for paper by ID":
                 self.search_subject = "paper"
@@ -66,47 +128,21 @@ class SemanticScholarUI:
 
         while True:
             p_msg = "How would you like to search for the paper?"
-            p_options = [
-                "S2PaperId",
-                "CorpusId",
-                "DOI",
-                "ArXivId",
-                "MAG",
-                "ACL",
-                "PMID",
-                "PMCID",
-            ]
-
-            param = self.choose_single_option(msg=p_msg, options=p_options)
-
-            if param in p_options:
-                id_formats = ["S2PaperId", "DOI", "ArXivId", "ACL"]
+            param = self.choose_single_option(msg=p_msg, options=PAPER_ID_OPTIONS)
+
+            if param in PAPER_ID_OPTIONS_SET:
+                regex = PAPER_ID_FORMATS.get(param, NUMERIC_ID_RE)
                 param_value = self.enter_text(
                     msg="Please enter the chosen ID in the right format "
                 )
 
-                if param in id_formats:
-                    correct_format = self.check_format(param=param, value=param_value)
-
-                    while not correct_format and param_value:
-                        param_value = self.enter_text(
-                            msg="Error: Invalid ID format. Please try again or press Enter."
-                        )
-
-                        correct_format = self.check_format(
-                            param=param, value=param_value
-                        )
-
-                else:
-                    while (
-                        not self.id_validation_with_regex(
-                            id_value=param_value, regex=r"^[0-9]+$"
-                        )
-                        and param_value
-                    ):
-                        param_value = self.enter_text(
-                            msg="Error: Invalid ID format. Please try again or press Enter."
-                        )
+                while (
+                    not self.id_validation_with_regex(id_value=param_value, regex=regex)
+                    and param_value
+                ):
+                    param_value = self.enter_text(
+                        msg="Error: Invalid ID format. Please try again or press Enter."
+                    )
 
                 if param_value:
                     paper_id_list.append(param_value)
@@ -139,9 +175,7 @@ class SemanticScholarUI:
                 msg="Please enter an S2 author ID in the right format "
             )
             while (
-                not self.id_validation_with_regex(
-                    id_value=param_value, regex=r"^[a-zA-Z0-9]+$"
-                )
+                not self.id_validation_with_regex(id_value=param_value, regex=S2_ID_RE)
                 and not validation_break
             ):
                 param_value = self.enter_text(
@@ -172,39 +206,67 @@ class SemanticScholarUI:
     def keyword_ui(self) -> None:
         """Ask user to enter Searchstring and limitations for Keyword search"""
 
-        query = self.enter_text(msg="Please enter the query for your keyword search ")
-        while not (query and isinstance(query, str)):
-            query = self.enter_text(
-                msg="Error: You must enter a query to conduct a search. Please enter a query"
+        # Note : all questions are asked in one inquirer session
+        questions = [
+            inquirer.Text(
+                name="query",
+                message="Please enter the query for your keyword search ",
+                validate=self._is_query,
+            ),
+            inquirer.Text(
+                name=Fields.YEAR,
+                message="Please enter a year span. "
+                "Please press Enter if you don't wish to specify a year span",
+                validate=self._is_year_span,
+            ),
+            inquirer.Text(
+                name="venue",
+                message="To search for papers from specific venues, enter the venues here."
+                + " Separate multiple venues by comma."
+                + " Please press Enter to not specify any venues ",
+            ),
+            inquirer.Checkbox(
+                name="fields_of_study",
+                message="If you want to restrict your search to certain study fields, "
+                "select them here or press Enter",
+                choices=STUDY_FIELDS,
+                carousel=False,
+            ),
+            inquirer.List(
+                name="open_access",
+                message="Would you like to only search for items "
+                "for which the full text is available as pdf?",
+                choices=["NO", "YES"],
+                carousel=False,
+            ),
+        ]
+        answers = inquirer.prompt(questions=questions)
+
+        self.search_params["query"] = answers["query"]
+        if answers[Fields.YEAR]:
+            self.search_params[Fields.YEAR] = answers[Fields.YEAR]
+        if answers["venue"]:
+            self.search_params["venue"] = answers["venue"].split(",")
+        if answers["fields_of_study"]:
+            self.search_params["fields_of_study"] = answers["fields_of_study"]
+        self.search_params["open_access_pdf"] = answers["open_access"] == "YES"
+
+    def _is_query(self, previous: dict, answer: str) -> bool:
+        """Validate that a query was entered"""
+        if not answer:
+            raise inquirer.errors.ValidationError(
+                "",
+                reason="Error: You must enter a query to conduct a search.",
             )
+        return True
 
-        self.search_params["query"] = query
-
-        year = self.enter_year()
-        if year:
-            self.search_params[Fields.YEAR] = year
-
-        venue = self.enter_text(
-            msg="To search for papers from specific venues, enter the venues here."
-            + " Separate multiple venues by comma."
-            + " Please press Enter to not specify any venues "
-        )
-        if venue:
-            self.search_params["venue"] = venue.split(",")
-
-        fields_of_study = self.enter_study_fields()
-        if fields_of_study:
-            self.search_params["fields_of_study"] = fields_of_study
-
-        open_access = self.choose_single_option(
-            msg="Would you like to only search for items "
-            "for which the full text is available as pdf?",
-            options=["NO", "YES"],
-        )
-        if open_access == "YES":
-            self.search_params["open_access_pdf"] = True
-        else:
-            self.search_params["open_access_pdf"] = False
+    def _is_year_span(self, previous: dict, answer: str) -> bool:
+        """Validate the year span (if any)"""
+        if answer:
+            error = self._get_year_span_error(answer)
+            if error:
+                raise inquirer.errors.ValidationError("", reason=error)
+        return True
 
     def get_api_key(self, existing_key: typing.Optional[str] = "") -> str:
         """Method to get API key from user input"""
@@ -237,7 +299,7 @@ class SemanticScholarUI:
                 else:
                     return ""
 
-            elif not re.match(r"^\w{40}$", api_key):
+            elif not API_KEY_RE.match(api_key):
                 print("Error: Invalid API key.\n")
                 fwd = self.choose_single_option(
                     msg="Would you like to enter a different key?",
@@ -262,95 +324,32 @@ class SemanticScholarUI:
 
         return api_key
 
-    def enter_year(self) -> str:
-        """Method to ask a specific year span in the format allowed by the SemanticScholar API"""
+    def _get_year_span_error(self, year_span: str) -> str:
+        """Get the error message for an invalid year span (empty if valid)"""
 
         examples = (
             "Examples for valid year spans: '2019'; '2012-2020'; '-2022'; '2015-'"
         )
-        ask_again = True
-        year_span = self.enter_text(
-            msg="Please enter a year span. "
-            "Please press Enter if you don't wish to specify a year span"
-        )
-        while year_span and ask_again:
-            ask_again = False
-            if not re.match(
-                "|".join([r"^-\d{4}$", r"^\d{4}-?$", r"^\d{4}-\d{4}$"]), year_span
-            ):
-                print("Error: Invalid year span.\n" + examples + "\n")
-                year_span = self.enter_text(
-                    msg="Please enter a year span."
-                    + " Please press Enter if you don't wish to specify a year span"
-                )
-                ask_again = True
-            elif re.match(r"^\d{4}-\d{4}$", year_span):
-                years = year_span.split("-")
-                year_a = int(years[0])
-                year_b = int(years[1])
-                if year_a >= year_b or (year_b > int(datetime.date.today().year)):
-                    print("Error: Invalid year span.\n" + examples + "\n")
-                    year_span = self.enter_text(
-                        msg="Please enter a year span."
-                        + " Please press Enter if you don't wish to specify a year span"
-                    )
-                    ask_again = True
-            elif re.match(r"^-?\d{4}-?$", year_span):
-                year = int(re.findall(r"\d{4}", year_span)[0])
-                if year > int(datetime.date.today().year):
-                    print(
-                        "Error: Invalid year span. You cannot search for papers from the future.\n"
-                    )
-                    year_span = self.enter_text(
-                        msg="Please enter a year span."
-                        + " Please press Enter if you don't wish to specify a year span"
-                    )
-                    ask_again = True
-
-        return year_span
-
-    def enter_study_fields(self) -> list:
-        """Method to ask a selection of fields of
-        study that are allowed by the Semantic Scholar API"""
-
-        msg = (
-            "If you want to restrict your search to certain study fields, "
-            "select them here or press Enter"
-        )
-        options = [
-            "Computer Science",
-            "Medicine",
-            "Chemistry",
-            "Biology",
-            "Materials Science",
-            "Physics",
-            "Geology",
-            "Psychology",
-            "Art",
-            "History",
-            "Geography",
-            "Sociology",
-            "Business",
-            "Political Science",
-            "Economics",
-            "Philosophy",
-            "Mathematics",
-            "Engineering",
-            "Environmental Science",
-            "Agricultural and Food Sciences",
-            "Education",
-            "Law",
-            "Linguistics",
-        ]
-        study_fields = self.choose_multiple_options(msg=msg, options=options)
-
-        return study_fields
+        current_year = datetime.date.today().year
+        if not YEAR_SPAN_RE.match(year_span):
+            return "Error: Invalid year span.\n" + examples
+        if YEAR_RANGE_RE.match(year_span):
+            years = year_span.split("-")
+            year_a = int(years[0])
+            year_b = int(years[1])
+            if year_a >= year_b or (year_b > current_year):
+                return "Error: Invalid year span.\n" + examples
+        elif OPEN_YEAR_SPAN_RE.match(year_span):
+            year = int(YEAR_RE.findall(year_span)[0])
+            if year > current_year:
+                return "Error: Invalid year span. You cannot search for papers from the future."
+        return ""
 
     def choose_single_option(
         self,
         *,
         msg: str,
-        options: list,
+        options: typing.Sequence[str],
     ) -> str:
         """Method to display a question with single choice answers to the console using inquirer"""
 
@@ -366,27 +365,6 @@ class SemanticScholarUI:
 
         return choice.get("Choice")
 
-    def choose_multiple_options(
-        self,
-        *,
-        msg: str,
-        options: list,
-    ) -> list:
-        """Method to display a question with multiple
-        choice answers to the console using inquirer"""
-
-        question = [
-            inquirer.Checkbox(
-                name="Choice",
-                message=msg,
-                choices=options,
-                carousel=False,
-            ),
-        ]
-        choice = inquirer.prompt(questions=question)
-
-        return choice.get("Choice")
-
     def enter_text(
         self,
         *,
@@ -409,30 +387,8 @@ class SemanticScholarUI:
         self,
         *,
         id_value: str,
-        regex: str,
+        regex: re.Pattern,
     ) -> bool:
-        """Method to validate ID formats using a regex as an argument"""
-
-        if re.match(regex, id_value):
-            return True
-
-        return False
-
-    def check_format(self, *, param: str, value: str) -> bool:
-        """Method to validate certain ID formats"""
-        if param == "S2PaperId":
-            if self.id_validation_with_regex(id_value=value, regex=r"^[a-zA-Z0-9]+$"):
-                return True
-        elif param == "DOI":
-            if self.id_validation_with_regex(id_value=value, regex=r"^10\..+$"):
-                return True
-
-        elif param == "ArXivId":
-            if self.id_validation_with_regex(id_value=value, regex=r"^\d+\.\d+$"):
-                return True
-
-        elif param == "ACL":
-            if self.id_validation_with_regex(id_value=value, regex=r"^\w+-\w+$"):
-                return True
+        """Method to validate ID formats using a (compiled) regex as an argument"""
 
-        return False
+        return _matches(regex, id_value)
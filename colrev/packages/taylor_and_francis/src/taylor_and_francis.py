@@ -95,7 +95,8 @@ class TaylorAndFrancisSearchSource:
                 record_dict[f"{self.endpoint}.eprint"] = record_dict.pop("eprint")
 
             for key in list(record_dict.keys()):
-                if key not in ["ID", "ENTRYTYPE"]:
+                # Note : keys that are already lower case are not re-inserted
+                if key not in ["ID", "ENTRYTYPE"] and not key.islower():
                     record_dict[key.lower()] = record_dict.pop(key)
 
         records = colrev.loader.load_utils.load(
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import re
 import shutil
+import sys
+import typing
 from pathlib import Path
 
 import pandas as pd
@@ -30,6 +32,150 @@ from colrev.constants import SearchType
 # pylint: disable=unused-argument
 # pylint: disable=duplicate-code
 
+YEAR_PATTERN = re.compile(r"\d{4}")
+# Note : years and ordinals are removed from booktitles first
+# so that acronyms like "(ICIS2020)" are removed by the second pass
+BOOKTITLE_NUMBERS_PATTERN = re.compile(r"\d{4}|\d{1,2}(?:th|nd|rd|st)")
+BOOKTITLE_NOISE_PATTERN = re.compile(r"\([A-Z]{3,6}\)|Proceedings of the|Proceedings")
+# Nicknames in parentheses (with surrounding whitespace) or runs of whitespace
+AUTHOR_NICKNAME_PATTERN = re.compile(r"\s*\([^)]*\)\s*|\s{2,}")
+# Page numbers, page ranges, or roman page ranges
+PAGES_PATTERN = re.compile(r"^(?:\d*|\d*--\d*|[xivXIV]*--[xivXIV]*)$")
+
+
+# Based on https://github.com/aurimasv/translators/wiki/RIS-Tag-Map
+RIS_REFERENCE_TYPES = {
+    "JOUR": ENTRYTYPES.ARTICLE,
+    "JFULL": ENTRYTYPES.ARTICLE,
+    "ABST": ENTRYTYPES.ARTICLE,
+    "INPR": ENTRYTYPES.ARTICLE,  # inpress
+    "CONF": ENTRYTYPES.INPROCEEDINGS,
+    "CPAPER": ENTRYTYPES.INPROCEEDINGS,
+    "THES": ENTRYTYPES.PHDTHESIS,
+    "REPT": ENTRYTYPES.TECHREPORT,
+    "RPRT": ENTRYTYPES.TECHREPORT,
+    "CHAP": ENTRYTYPES.INBOOK,
+    "BOOK": ENTRYTYPES.BOOK,
+    "NEWS": ENTRYTYPES.MISC,
+    "BLOG": ENTRYTYPES.MISC,
+}
+
+# Based on https://github.com/aurimasv/translators/wiki/RIS-Tag-Map
+RIS_KEY_MAPS = {
+    ENTRYTYPES.ARTICLE: {
+        "PY": Fields.YEAR,
+        "AU": Fields.AUTHOR,
+        "TI": Fields.TITLE,
+        "T2": Fields.JOURNAL,
+        "AB": Fields.ABSTRACT,
+        "VL": Fields.VOLUME,
+        "IS": Fields.NUMBER,
+        "DO": Fields.DOI,
+        "PB": Fields.PUBLISHER,
+        "UR": Fields.URL,
+        "fulltext": Fields.FULLTEXT,
+        "PMID": Fields.PUBMED_ID,
+        "KW": Fields.KEYWORDS,
+        "SP": Fields.PAGES,
+    },
+    ENTRYTYPES.INPROCEEDINGS: {
+        "PY": Fields.YEAR,
+        "AU": Fields.AUTHOR,
+        "TI": Fields.TITLE,
+        # "secondary_title": Fields.BOOKTITLE,
+        "DO": Fields.DOI,
+        "UR": Fields.URL,
+        # "fulltext": Fields.FULLTEXT,
+        "PMID": Fields.PUBMED_ID,
+        "KW": Fields.KEYWORDS,
+        "SP": Fields.PAGES,
+    },
+    ENTRYTYPES.INBOOK: {
+        "PY": Fields.YEAR,
+        "AU": Fields.AUTHOR,
+        # "primary_title": Fields.CHAPTER,
+        # "secondary_title": Fields.TITLE,
+        "DO": Fields.DOI,
+        "PB": Fields.PUBLISHER,
+        # "edition": Fields.EDITION,
+        "UR": Fields.URL,
+        # "fulltext": Fields.FULLTEXT,
+        "KW": Fields.KEYWORDS,
+        "SP": Fields.PAGES,
+    },
+    ENTRYTYPES.BOOK: {
+        "PY": Fields.YEAR,
+        "AU": Fields.AUTHOR,
+        # "primary_title": Fields.CHAPTER,
+        # "secondary_title": Fields.TITLE,
+        "DO": Fields.DOI,
+        "PB": Fields.PUBLISHER,
+        # "edition": Fields.EDITION,
+        "UR": Fields.URL,
+        # "fulltext": Fields.FULLTEXT,
+        "KW": Fields.KEYWORDS,
+        "SP": Fields.PAGES,
+    },
+    ENTRYTYPES.PHDTHESIS: {
+        "PY": Fields.YEAR,
+        "AU": Fields.AUTHOR,
+        "TI": Fields.TITLE,
+        "UR": Fields.URL,
+    },
+    ENTRYTYPES.TECHREPORT: {
+        "PY": Fields.YEAR,
+        "AU": Fields.AUTHOR,
+        "TI": Fields.TITLE,
+        "UR": Fields.URL,
+        # "fulltext": Fields.FULLTEXT,
+        "KW": Fields.KEYWORDS,
+        "PB": Fields.PUBLISHER,
+        "SP": Fields.PAGES,
+    },
+    ENTRYTYPES.MISC: {
+        "PY": Fields.YEAR,
+        "AU": Fields.AUTHOR,
+        "TI": Fields.TITLE,
+        "UR": Fields.URL,
+        # "fulltext": Fields.FULLTEXT,
+        "KW": Fields.KEYWORDS,
+        "PB": Fields.PUBLISHER,
+        "SP": Fields.PAGES,
+    },
+}
+
+# Note : EP is dropped after it is combined with SP (if SP is not mapped)
+RIS_DROPPED_KEYS = frozenset({"TY", "Y2", "DB", "C1", "T3", "AD", "CY", "M3", "ER"})
+
+ENL_KEY_MAPS = {
+    ENTRYTYPES.ARTICLE: {
+        "T": Fields.TITLE,
+        "A": Fields.AUTHOR,
+        "D": Fields.YEAR,
+        "B": Fields.JOURNAL,
+        "V": Fields.VOLUME,
+        "N": Fields.NUMBER,
+        "P": Fields.PAGES,
+        "X": Fields.ABSTRACT,
+        "U": Fields.URL,
+        "8": "date",
+        "0": "type",
+    },
+    ENTRYTYPES.INPROCEEDINGS: {
+        "T": Fields.TITLE,
+        "A": Fields.AUTHOR,
+        "D": Fields.YEAR,
+        "B": Fields.JOURNAL,
+        "V": Fields.VOLUME,
+        "N": Fields.NUMBER,
+        "P": Fields.PAGES,
+        "X": Fields.ABSTRACT,
+        "U": Fields.URL,
+        "8": "date",
+        "0": "type",
+    },
+}
+
 
 @zope.interface.implementer(colrev.package_manager.interfaces.SearchSourceInterface)
 class UnknownSearchSource:
@@ -54,6 +200,21 @@ class UnknownSearchSource:
 
     HTML_CLEANER = re.compile("<.*?>")
     _padding = 40
+    _format_detection_chars = 65536
+    # Values indicating empty table fields (per column name, populated lazily)
+    _table_empty_values: typing.Dict[str, tuple] = {}
+    _load_methods = {
+        ".ris": "_load_ris",
+        ".bib": "_load_bib",
+        ".csv": "_load_table",
+        ".xls": "_load_table",
+        ".xlsx": "_load_table",
+        ".md": "_load_md",
+        ".enl": "_load_enl",
+    }
+    _keys_to_drop_on_load = frozenset(
+        FieldSet.PROVENANCE_KEYS + [Fields.SCREENING_CRITERIA]
+    )
 
     def __init__(
         self, *, source_operation: colrev.process.operation.Operation, settings: dict
@@ -112,158 +273,53 @@ class UnknownSearchSource:
     def _rename_erroneous_extensions(self) -> None:
         if self.search_source.filename.suffix in [".xls", ".xlsx"]:
             return
-        data = self.search_source.filename.read_text(encoding="utf-8")
+        # The format is determined based on the beginning of the file
+        with open(self.search_source.filename, encoding="utf-8") as file:
+            data = file.read(self._format_detection_chars)
         # # Correct the file extension if necessary
-        if re.findall(
-            r"^%0", data, re.MULTILINE
-        ) and self.search_source.filename.suffix not in [".enl"]:
-            new_filename = self.search_source.filename.with_suffix(".enl")
-            self.review_manager.logger.info(
-                f"{Colors.GREEN}Rename to {new_filename} "
-                f"(because the format is .enl){Colors.END}"
-            )
-            shutil.move(str(self.search_source.filename), str(new_filename))
-            self.review_manager.dataset.add_changes(
-                self.search_source.filename, remove=True
-            )
-            self.search_source.filename = new_filename
-            self.review_manager.dataset.add_changes(new_filename)
-            self.review_manager.dataset.create_commit(
-                msg=f"Rename {self.search_source.filename}"
-            )
+        # Note : substring tests (instead of re.findall(..., re.MULTILINE))
+        # stop at the first line starting with %0 (or TI)
+        if data.startswith("%0") or "\n%0" in data:
+            correct_suffix = ".enl"
+        elif data.startswith("TI ") or "\nTI " in data:
+            correct_suffix = ".ris"
+        else:
+            return
+        if self.search_source.filename.suffix == correct_suffix:
             return
 
-        if re.findall(
-            r"^TI ", data, re.MULTILINE
-        ) and self.search_source.filename.suffix not in [".ris"]:
-            new_filename = self.search_source.filename.with_suffix(".ris")
-            self.review_manager.logger.info(
-                f"{Colors.GREEN}Rename to {new_filename} "
-                f"(because the format is .ris){Colors.END}"
-            )
-            shutil.move(str(self.search_source.filename), str(new_filename))
-            self.review_manager.dataset.add_changes(
-                self.search_source.filename, remove=True
-            )
-            self.search_source.filename = new_filename
-            self.review_manager.dataset.add_changes(new_filename)
-            self.review_manager.dataset.create_commit(
-                msg=f"Rename {self.search_source.filename}"
-            )
+        new_filename = self.search_source.filename.with_suffix(correct_suffix)
+        self.review_manager.logger.info(
+            f"{Colors.GREEN}Rename to {new_filename} "
+            f"(because the format is {correct_suffix}){Colors.END}"
+        )
+        shutil.move(str(self.search_source.filename), str(new_filename))
+        self.review_manager.dataset.add_changes(
+            self.search_source.filename, remove=True
+        )
+        self.search_source.filename = new_filename
+        self.review_manager.dataset.add_changes(new_filename)
+        self.review_manager.dataset.create_commit(
+            msg=f"Rename {self.search_source.filename}"
+        )
 
     def _load_ris(self, *, load_operation: colrev.ops.load.Load) -> dict:
         def entrytype_setter(record_dict: dict) -> None:
-            # Based on https://github.com/aurimasv/translators/wiki/RIS-Tag-Map
-            reference_types = {
-                "JOUR": ENTRYTYPES.ARTICLE,
-                "JFULL": ENTRYTYPES.ARTICLE,
-                "ABST": ENTRYTYPES.ARTICLE,
-                "INPR": ENTRYTYPES.ARTICLE,  # inpress
-                "CONF": ENTRYTYPES.INPROCEEDINGS,
-                "CPAPER": ENTRYTYPES.INPROCEEDINGS,
-                "THES": ENTRYTYPES.PHDTHESIS,
-                "REPT": ENTRYTYPES.TECHREPORT,
-                "RPRT": ENTRYTYPES.TECHREPORT,
-                "CHAP": ENTRYTYPES.INBOOK,
-                "BOOK": ENTRYTYPES.BOOK,
-                "NEWS": ENTRYTYPES.MISC,
-                "BLOG": ENTRYTYPES.MISC,
-            }
-            if record_dict["TY"] in reference_types:
-                record_dict[Fields.ENTRYTYPE] = reference_types[record_dict["TY"]]
+            if record_dict["TY"] in RIS_REFERENCE_TYPES:
+                record_dict[Fields.ENTRYTYPE] = RIS_REFERENCE_TYPES[record_dict["TY"]]
             else:
                 record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
 
         def field_mapper(record_dict: dict) -> None:
-            # Based on https://github.com/aurimasv/translators/wiki/RIS-Tag-Map
-            key_maps = {
-                ENTRYTYPES.ARTICLE: {
-                    "PY": Fields.YEAR,
-                    "AU": Fields.AUTHOR,
-                    "TI": Fields.TITLE,
-                    "T2": Fields.JOURNAL,
-                    "AB": Fields.ABSTRACT,
-                    "VL": Fields.VOLUME,
-                    "IS": Fields.NUMBER,
-                    "DO": Fields.DOI,
-                    "PB": Fields.PUBLISHER,
-                    "UR": Fields.URL,
-                    "fulltext": Fields.FULLTEXT,
-                    "PMID": Fields.PUBMED_ID,
-                    "KW": Fields.KEYWORDS,
-                    "SP": Fields.PAGES,
-                },
-                ENTRYTYPES.INPROCEEDINGS: {
-                    "PY": Fields.YEAR,
-                    "AU": Fields.AUTHOR,
-                    "TI": Fields.TITLE,
-                    # "secondary_title": Fields.BOOKTITLE,
-                    "DO": Fields.DOI,
-                    "UR": Fields.URL,
-                    # "fulltext": Fields.FULLTEXT,
-                    "PMID": Fields.PUBMED_ID,
-                    "KW": Fields.KEYWORDS,
-                    "SP": Fields.PAGES,
-                },
-                ENTRYTYPES.INBOOK: {
-                    "PY": Fields.YEAR,
-                    "AU": Fields.AUTHOR,
-                    # "primary_title": Fields.CHAPTER,
-                    # "secondary_title": Fields.TITLE,
-                    "DO": Fields.DOI,
-                    "PB": Fields.PUBLISHER,
-                    # "edition": Fields.EDITION,
-                    "UR": Fields.URL,
-                    # "fulltext": Fields.FULLTEXT,
-                    "KW": Fields.KEYWORDS,
-                    "SP": Fields.PAGES,
-                },
-                ENTRYTYPES.BOOK: {
-                    "PY": Fields.YEAR,
-                    "AU": Fields.AUTHOR,
-                    # "primary_title": Fields.CHAPTER,
-                    # "secondary_title": Fields.TITLE,
-                    "DO": Fields.DOI,
-                    "PB": Fields.PUBLISHER,
-                    # "edition": Fields.EDITION,
-                    "UR": Fields.URL,
-                    # "fulltext": Fields.FULLTEXT,
-                    "KW": Fields.KEYWORDS,
-                    "SP": Fields.PAGES,
-                },
-                ENTRYTYPES.PHDTHESIS: {
-                    "PY": Fields.YEAR,
-                    "AU": Fields.AUTHOR,
-                    "TI": Fields.TITLE,
-                    "UR": Fields.URL,
-                },
-                ENTRYTYPES.TECHREPORT: {
-                    "PY": Fields.YEAR,
-                    "AU": Fields.AUTHOR,
-                    "TI": Fields.TITLE,
-                    "UR": Fields.URL,
-                    # "fulltext": Fields.FULLTEXT,
-                    "KW": Fields.KEYWORDS,
-                    "PB": Fields.PUBLISHER,
-                    "SP": Fields.PAGES,
-                },
-                ENTRYTYPES.MISC: {
-                    "PY": Fields.YEAR,
-                    "AU": Fields.AUTHOR,
-                    "TI": Fields.TITLE,
-                    "UR": Fields.URL,
-                    # "fulltext": Fields.FULLTEXT,
-                    "KW": Fields.KEYWORDS,
-                    "PB": Fields.PUBLISHER,
-                    "SP": Fields.PAGES,
-                },
+            key_map = RIS_KEY_MAPS[record_dict[Fields.ENTRYTYPE]]
+            # Note : unmapped (parsed) keys are interned to share them across records
+            mapped_record_dict = {
+                key_map.get(ris_key) or sys.intern(ris_key): value
+                for ris_key, value in record_dict.items()
+                if ris_key not in RIS_DROPPED_KEYS
             }
-
-            key_map = key_maps[record_dict[Fields.ENTRYTYPE]]
-            for ris_key in list(record_dict.keys()):
-                if ris_key in key_map:
-                    standard_key = key_map[ris_key]
-                    record_dict[standard_key] = record_dict.pop(ris_key)
+            record_dict.clear()
+            record_dict.update(mapped_record_dict)
 
             if "SP" in record_dict and "EP" in record_dict:
                 record_dict[Fields.PAGES] = (
@@ -283,16 +339,7 @@ class UnknownSearchSource:
             ):
                 record_dict[Fields.KEYWORDS] = ", ".join(record_dict[Fields.KEYWORDS])
 
-            record_dict.pop("TY", None)
-            record_dict.pop("Y2", None)
-            record_dict.pop("DB", None)
-            record_dict.pop("C1", None)
-            record_dict.pop("T3", None)
-            record_dict.pop("AD", None)
-            record_dict.pop("CY", None)
-            record_dict.pop("M3", None)
             record_dict.pop("EP", None)
-            record_dict.pop("ER", None)
 
             for key, value in record_dict.items():
                 record_dict[key] = str(value)
@@ -316,27 +363,31 @@ class UnknownSearchSource:
         return records
 
     # pylint: disable=colrev-missed-constant-usage
-    def _table_drop_fields(self, *, record_dict: dict) -> None:
-        for key in list(record_dict.keys()):
-            if record_dict[key] in [f"no {key}", "", "nan"]:
-                del record_dict[key]
-        if (
-            record_dict.get("number_of_cited_references", "NA")
-            == "no Number-of-Cited-References"
-        ):
-            del record_dict["number_of_cited_references"]
-        if "no file" in record_dict.get("file_name", "NA"):
-            del record_dict["file_name"]
+    @classmethod
+    def _is_table_field_to_drop(cls, key: str, value: typing.Any) -> bool:
+        empty_values = cls._table_empty_values.get(key)
+        if empty_values is None:
+            empty_values = cls._table_empty_values.setdefault(
+                key, ("", "nan", f"no {key}")
+            )
+        return (
+            value in empty_values
+            or key in ("author_count", "citation_key")
+            or (
+                key == "number_of_cited_references"
+                and value == "no Number-of-Cited-References"
+            )
+            or (key == "file_name" and "no file" in value)
+            or (key == "cited_by" and value == "no Times-Cited")
+        )
 
-        if record_dict.get("cited_by", "NA") in [
-            "no Times-Cited",
+    def _table_drop_fields(self, *, record_dict: dict) -> None:
+        for key in [
+            key
+            for key, value in record_dict.items()
+            if self._is_table_field_to_drop(key, value)
         ]:
-            del record_dict["cited_by"]
-
-        if "author_count" in record_dict:
-            del record_dict["author_count"]
-        if "citation_key" in record_dict:
-            del record_dict["citation_key"]
+            del record_dict[key]
 
     def _load_table(self, *, load_operation: colrev.ops.load.Load) -> dict:
         def entrytype_setter(record_dict: dict) -> None:
@@ -398,7 +449,7 @@ class UnknownSearchSource:
             ):
                 record_dict[Fields.JOURNAL] = record_dict.pop("journal/book")
 
-            if "author" in record_dict and ";" in record_dict["author"]:
+            if "author" in record_dict:
                 record_dict["author"] = record_dict["author"].replace("; ", " and ")
 
             self._table_drop_fields(record_dict=record_dict)
@@ -453,41 +504,11 @@ class UnknownSearchSource:
                     record_dict[Fields.ENTRYTYPE] = ENTRYTYPES.MISC
 
         def field_mapper(record_dict: dict) -> None:
-
-            key_maps = {
-                ENTRYTYPES.ARTICLE: {
-                    "T": Fields.TITLE,
-                    "A": Fields.AUTHOR,
-                    "D": Fields.YEAR,
-                    "B": Fields.JOURNAL,
-                    "V": Fields.VOLUME,
-                    "N": Fields.NUMBER,
-                    "P": Fields.PAGES,
-                    "X": Fields.ABSTRACT,
-                    "U": Fields.URL,
-                    "8": "date",
-                    "0": "type",
-                },
-                ENTRYTYPES.INPROCEEDINGS: {
-                    "T": Fields.TITLE,
-                    "A": Fields.AUTHOR,
-                    "D": Fields.YEAR,
-                    "B": Fields.JOURNAL,
-                    "V": Fields.VOLUME,
-                    "N": Fields.NUMBER,
-                    "P": Fields.PAGES,
-                    "X": Fields.ABSTRACT,
-                    "U": Fields.URL,
-                    "8": "date",
-                    "0": "type",
-                },
-            }
-
-            key_map = key_maps[record_dict[Fields.ENTRYTYPE]]
-            for ris_key in list(record_dict.keys()):
+            key_map = ENL_KEY_MAPS[record_dict[Fields.ENTRYTYPE]]
+            pop = record_dict.pop
+            for ris_key in list(record_dict):
                 if ris_key in key_map:
-                    standard_key = key_map[ris_key]
-                    record_dict[standard_key] = record_dict.pop(ris_key)
+                    record_dict[key_map[ris_key]] = pop(ris_key)
 
             if Fields.AUTHOR in record_dict and isinstance(
                 record_dict[Fields.AUTHOR], list
@@ -502,7 +523,7 @@ class UnknownSearchSource:
             ):
                 record_dict[Fields.KEYWORDS] = ", ".join(record_dict[Fields.KEYWORDS])
 
-            record_dict.pop("type", None)
+            pop("type", None)
 
             for key, value in record_dict.items():
                 record_dict[key] = str(value)
@@ -525,27 +546,17 @@ class UnknownSearchSource:
 
         self._rename_erroneous_extensions()
 
-        __load_methods = {
-            ".ris": self._load_ris,
-            ".bib": self._load_bib,
-            ".csv": self._load_table,
-            ".xls": self._load_table,
-            ".xlsx": self._load_table,
-            ".md": self._load_md,
-            ".enl": self._load_enl,
-        }
-
-        if self.search_source.filename.suffix not in __load_methods:
+        if self.search_source.filename.suffix not in self._load_methods:
             raise NotImplementedError
 
-        records = __load_methods[self.search_source.filename.suffix](
+        records = getattr(self, self._load_methods[self.search_source.filename.suffix])(
             load_operation=load_operation
         )
         for record_id in records:
             records[record_id] = {
                 k: v
                 for k, v in records[record_id].items()
-                if k not in FieldSet.PROVENANCE_KEYS + [Fields.SCREENING_CRITERIA]
+                if k not in self._keys_to_drop_on_load
             }
         for record in records.values():
             for key in list(record.keys()):
@@ -595,47 +606,27 @@ class UnknownSearchSource:
             ):
                 record.rename_field(key=Fields.TITLE, new_key=Fields.CHAPTER)
 
-        if (
-            "dissertation" in record.data.get(Fields.FULLTEXT, "NA").lower()
-            and record.data[Fields.ENTRYTYPE] != "phdthesis"
-        ):
-            prior_e_type = record.data[Fields.ENTRYTYPE]
-            record.update_field(
-                key=Fields.ENTRYTYPE, value="phdthesis", source="unkown_source_prep"
-            )
-            self.review_manager.report_logger.info(
-                f" {record.data[Fields.ID]}".ljust(self._padding, " ")
-                + f"Set from {prior_e_type} to phdthesis "
-                '("dissertation" in fulltext link)'
-            )
+        if record.data[Fields.ENTRYTYPE] == "phdthesis":
+            return
 
-        if (
-            "thesis" in record.data.get(Fields.FULLTEXT, "NA").lower()
-            and record.data[Fields.ENTRYTYPE] != "phdthesis"
-        ):
-            prior_e_type = record.data[Fields.ENTRYTYPE]
-            record.update_field(
-                key=Fields.ENTRYTYPE, value="phdthesis", source="unkown_source_prep"
-            )
-            self.review_manager.report_logger.info(
-                f" {record.data[Fields.ID]}".ljust(self._padding, " ")
-                + f"Set from {prior_e_type} to phdthesis "
-                '("thesis" in fulltext link)'
-            )
+        fulltext = record.data.get(Fields.FULLTEXT, "NA").lower()
+        if "dissertation" in fulltext:
+            reason = '"dissertation" in fulltext link'
+        elif "thesis" in fulltext:
+            reason = '"thesis" in fulltext link'
+        elif "this thesis" in record.data.get(Fields.ABSTRACT, "NA").lower():
+            reason = '"thesis" in abstract'
+        else:
+            return
 
-        if (
-            "this thesis" in record.data.get(Fields.ABSTRACT, "NA").lower()
-            and record.data[Fields.ENTRYTYPE] != "phdthesis"
-        ):
-            prior_e_type = record.data[Fields.ENTRYTYPE]
-            record.update_field(
-                key=Fields.ENTRYTYPE, value="phdthesis", source="unkown_source_prep"
-            )
-            self.review_manager.report_logger.info(
-                f" {record.data[Fields.ID]}".ljust(self._padding, " ")
-                + f"Set from {prior_e_type} to phdthesis "
-                '("thesis" in abstract)'
-            )
+        prior_e_type = record.data[Fields.ENTRYTYPE]
+        record.update_field(
+            key=Fields.ENTRYTYPE, value="phdthesis", source="unkown_source_prep"
+        )
+        self.review_manager.report_logger.info(
+            f" {record.data[Fields.ID]}".ljust(self._padding, " ")
+            + f"Set from {prior_e_type} to phdthesis ({reason})"
+        )
 
     def _format_inproceedings(
         self, *, record: colrev.record.record_prep.PrepRecord
@@ -653,16 +644,10 @@ class UnknownSearchSource:
             # pylint: disable=colrev-missed-constant-usage
             record.format_if_mostly_upper(Fields.BOOKTITLE, case="title")
 
-            stripped_btitle = re.sub(r"\d{4}", "", record.data[Fields.BOOKTITLE])
-            stripped_btitle = re.sub(r"\d{1,2}th", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\d{1,2}nd", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\d{1,2}rd", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\d{1,2}st", "", stripped_btitle)
-            stripped_btitle = re.sub(r"\([A-Z]{3,6}\)", "", stripped_btitle)
-            stripped_btitle = stripped_btitle.replace("Proceedings of the", "").replace(
-                "Proceedings", ""
+            stripped_btitle = BOOKTITLE_NUMBERS_PATTERN.sub(
+                "", record.data[Fields.BOOKTITLE]
             )
-            stripped_btitle = stripped_btitle.lstrip().rstrip()
+            stripped_btitle = BOOKTITLE_NOISE_PATTERN.sub("", stripped_btitle).strip()
             record.update_field(
                 key=Fields.BOOKTITLE,
                 value=stripped_btitle,
@@ -709,23 +694,16 @@ class UnknownSearchSource:
                     keep_source_if_equal=True,
                 )
             # Replace nicknames in parentheses
-            record.data[Fields.AUTHOR] = re.sub(
-                r"\([^)]*\)", "", record.data[Fields.AUTHOR]
-            )
-            record.data[Fields.AUTHOR] = (
-                record.data[Fields.AUTHOR].replace("  ", " ").rstrip()
-            )
+            record.data[Fields.AUTHOR] = AUTHOR_NICKNAME_PATTERN.sub(
+                " ", record.data[Fields.AUTHOR]
+            ).strip()
 
         if record.data.get(Fields.TITLE, FieldValues.UNKNOWN) != FieldValues.UNKNOWN:
             record.format_if_mostly_upper(Fields.TITLE)
 
         if Fields.PAGES in record.data:
             record.unify_pages_field()
-            if (
-                not re.match(r"^\d*$", record.data[Fields.PAGES])
-                and not re.match(r"^\d*--\d*$", record.data[Fields.PAGES])
-                and not re.match(r"^[xivXIV]*--[xivXIV]*$", record.data[Fields.PAGES])
-            ):
+            if not PAGES_PATTERN.match(record.data[Fields.PAGES]):
                 self.review_manager.report_logger.info(
                     f" {record.data[Fields.ID]}:".ljust(self._padding, " ")
                     + f"Unusual pages: {record.data[Fields.PAGES]}"
@@ -754,37 +732,30 @@ class UnknownSearchSource:
         self, *, record: colrev.record.record_prep.PrepRecord
     ) -> None:
         if (
-            record.data[Fields.ENTRYTYPE] == "article"
+            record.data[Fields.ENTRYTYPE] in ["article", "inproceedings"]
             and Fields.JOURNAL in record.data
             and Fields.BOOKTITLE in record.data
         ):
+            # score_cutoff: rapidfuzz returns 0 for lower similarities (early exit)
             similarity_journal_booktitle = fuzz.partial_ratio(
                 record.data[Fields.JOURNAL].lower(),
                 record.data[Fields.BOOKTITLE].lower(),
+                score_cutoff=90,
             )
-            if similarity_journal_booktitle / 100 > 0.9:
-                record.remove_field(key=Fields.BOOKTITLE)
+            if similarity_journal_booktitle > 90:
+                if record.data[Fields.ENTRYTYPE] == "article":
+                    record.remove_field(key=Fields.BOOKTITLE)
+                else:
+                    record.remove_field(key=Fields.JOURNAL)
 
         if record.data.get(Fields.PUBLISHER, "") in ["researchgate.net"]:
             record.remove_field(key=Fields.PUBLISHER)
 
-        if (
-            record.data[Fields.ENTRYTYPE] == "inproceedings"
-            and Fields.JOURNAL in record.data
-            and Fields.BOOKTITLE in record.data
-        ):
-            similarity_journal_booktitle = fuzz.partial_ratio(
-                record.data[Fields.JOURNAL].lower(),
-                record.data[Fields.BOOKTITLE].lower(),
-            )
-            if similarity_journal_booktitle / 100 > 0.9:
-                record.remove_field(key=Fields.JOURNAL)
-
     def _impute_missing_fields(
         self, *, record: colrev.record.record_prep.PrepRecord
     ) -> None:
         if "date" in record.data and Fields.YEAR not in record.data:
-            year = re.search(r"\d{4}", record.data["date"])
+            year = YEAR_PATTERN.search(record.data["date"])
             if year:
                 record.update_field(
                     key=Fields.YEAR,
@@ -796,11 +767,11 @@ class UnknownSearchSource:
     def _unify_special_characters(
         self, *, record: colrev.record.record_prep.PrepRecord
     ) -> None:
-        # Remove html entities
-        for field in list(record.data.keys()):
-            if field in [Fields.TITLE, Fields.AUTHOR, Fields.JOURNAL, Fields.BOOKTITLE]:
-                record.data[field] = re.sub(r"\s+", " ", record.data[field])
-                record.data[field] = re.sub(self.HTML_CLEANER, "", record.data[field])
+        # Collapse whitespace before removing html tags (tags may span lines)
+        for field in [Fields.TITLE, Fields.AUTHOR, Fields.JOURNAL, Fields.BOOKTITLE]:
+            if field in record.data:
+                value = " ".join(record.data[field].split())
+                record.data[field] = self.HTML_CLEANER.sub("", value)
 
     def prepare(
         self,
@@ -809,7 +780,8 @@ class UnknownSearchSource:
     ) -> colrev.record.record.Record:
         """Source-specific preparation for unknown sources"""
 
-        if not record.has_quality_defects() or record.masterdata_is_curated():
+        # Note : the curation check is a single lookup (quality defects: all notes)
+        if record.masterdata_is_curated() or not record.has_quality_defects():
             return record
 
         # we may assign fields heuristically (e.g., to colrev.pubmed.pubmedid)
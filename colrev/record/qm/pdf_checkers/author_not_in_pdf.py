@@ -12,6 +12,8 @@ from colrev.constants import PDFDefectCodes
 
 # pylint: disable=too-few-public-methods
 
+NON_LETTERS_REGEX = re.compile("[^a-zA-Z ]+")
+
 # Note: replaces author_not_in_first_pages
 
 
@@ -49,7 +51,7 @@ class AuthorNotInPDFChecker:
 
         text = record.data[Fields.TEXT_FROM_PDF].lower()
         text = colrev.env.utils.remove_accents(text)
-        text = re.sub("[^a-zA-Z ]+", "", text)
+        text = NON_LETTERS_REGEX.sub("", text)
         text = text.replace("ue", "u").replace("ae", "a").replace("oe", "o")
 
         authors_str = record.data.get(Fields.AUTHOR, "").lower()
@@ -59,16 +61,24 @@ class AuthorNotInPDFChecker:
         authors_str = colrev.env.utils.remove_accents(authors_str)
         authors_str = re.sub("[^a-zA-Z, ]+", "", authors_str)
 
-        match_count = 0
-        for author_name in authors_str.split(" and "):
-            # Only check last names because first names amy be abbreviated
-            author_name = author_name.split(",")[0].replace(" ", "")
-            if author_name in text:
+        # Only check last names because first names amy be abbreviated
+        last_names = [
+            author_name.split(",")[0].replace(" ", "")
+            for author_name in authors_str.split(" and ")
+        ]
+        # More than 80% of the last names must be in the text
+        required_matches = 8 * len(last_names) // 10 + 1
+        allowed_misses = len(last_names) - required_matches
+        match_count, miss_count = 0, 0
+        for last_name in last_names:
+            if last_name in text:
                 match_count += 1
-
-        nr_authors = len(authors_str.split(" and "))
-        if match_count / nr_authors > 0.8:
-            return True
+                if match_count >= required_matches:
+                    return True
+            else:
+                miss_count += 1
+                if miss_count > allowed_misses:
+                    return False
 
         return False
 
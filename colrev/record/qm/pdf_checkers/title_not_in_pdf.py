@@ -12,6 +12,8 @@ from colrev.constants import PDFDefectCodes
 
 # pylint: disable=too-few-public-methods
 
+NON_LETTERS_REGEX = re.compile("[^a-zA-Z ]+")
+
 # Note: replaces title_not_in_first_pages
 
 
@@ -46,19 +48,27 @@ class TitleNotInPDFChecker:
         text = record.data[Fields.TEXT_FROM_PDF]
         text = text.replace(" ", "").replace("\n", "").lower()
         text = colrev.env.utils.remove_accents(text)
-        text = re.sub("[^a-zA-Z ]+", "", text)
+        text = NON_LETTERS_REGEX.sub("", text)
 
         title_words = (
-            re.sub("[^a-zA-Z ]+", "", record.data[Fields.TITLE]).lower().split()
+            NON_LETTERS_REGEX.sub("", record.data[Fields.TITLE]).lower().split()
         )
 
-        match_count = 0
+        # Note : text has no whitespace (substring matches instead of set operations)
+        # More than 90% of the title words must be in the text
+        # (integer comparison: match_count * 10 > 9 * len(title_words))
+        required_matches = 9 * len(title_words) // 10 + 1
+        allowed_misses = len(title_words) - required_matches
+        match_count, miss_count = 0, 0
         for title_word in title_words:
             if title_word in text:
                 match_count += 1
-
-        if match_count / len(title_words) > 0.9:
-            return True
+                if match_count >= required_matches:
+                    return True
+            else:
+                miss_count += 1
+                if miss_count > allowed_misses:
+                    return False
 
         return False
 
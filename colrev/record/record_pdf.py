@@ -83,10 +83,13 @@ class PDFRecord(colrev.record.record.Record):
         pdf_path = self._get_path()
         text_list: list = []
         with pymupdf.open(pdf_path) as doc:
-            for i, page in enumerate(doc):
-                if pages is None or i in pages:
-                    text = page.get_text()
-                    text_list.append(text)
+            if pages is None:
+                page_nrs: typing.Iterable[int] = range(doc.page_count)
+            else:
+                # Only load the requested pages (not all pages of long PDFs)
+                page_nrs = sorted(i for i in set(pages) if 0 <= i < doc.page_count)
+            for i in page_nrs:
+                text_list.append(doc.load_page(i).get_text())
 
         text_all = "".join(text_list)
         return self._fix_text_encoding_issues(text_all)
@@ -99,11 +102,11 @@ class PDFRecord(colrev.record.record.Record):
             pages_in_file = doc.page_count
         self.data[Fields.NR_PAGES_IN_FILE] = pages_in_file
 
-    def set_text_from_pdf(self) -> None:
-        """Set the text_from_pdf field based on the PDF"""
+    def set_text_from_pdf(self, *, max_pages: int = 3) -> None:
+        """Set the text_from_pdf field based on the first pages of the PDF"""
         self.data[Fields.TEXT_FROM_PDF] = ""
         self.set_nr_pages_in_pdf()
-        text = self.extract_text_by_page(pages=[0, 1, 2])
+        text = self.extract_text_by_page(pages=list(range(max_pages)))
         text_from_pdf = text.replace("\n", " ").replace("\x0c", "")
         self.data[Fields.TEXT_FROM_PDF] = text_from_pdf
 
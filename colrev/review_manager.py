@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 import os
 import pprint
+import threading
 import typing
 from datetime import timedelta
 from pathlib import Path
@@ -48,6 +49,8 @@ class ReviewManager:
 
     shell_mode = False
 
+    _cached_sessions = threading.local()
+
     def __init__(
         self,
         *,
@@ -388,13 +391,19 @@ class ReviewManager:
 
     @classmethod
     def get_cached_session(cls) -> requests_cache.CachedSession:  # pragma: no cover
-        """Get a cached session"""
-
-        return requests_cache.CachedSession(
-            str(Filepaths.PREP_REQUESTS_CACHE_FILE),
-            backend="sqlite",
-            expire_after=timedelta(days=30),
-        )
+        """Get a cached session (reused within the calling thread)"""
+
+        # Note : sessions are not thread-safe. Each thread (e.g., of the prep pool)
+        # reuses its own session instead of opening the sqlite cache per request.
+        session = getattr(cls._cached_sessions, "session", None)
+        if session is None:
+            session = requests_cache.CachedSession(
+                str(Filepaths.PREP_REQUESTS_CACHE_FILE),
+                backend="sqlite",
+                expire_after=timedelta(days=30),
+            )
+            cls._cached_sessions.session = session
+        return session
 
     @classmethod
     def get_resources(cls) -> colrev.env.resources.Resources:  # pragma: no cover
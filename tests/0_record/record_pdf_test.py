@@ -30,9 +30,15 @@ def test_set_text_from_pdf(helpers, record_with_pdf: colrev.record.record_pdf.PD
     )
     record_with_pdf.set_text_from_pdf()
     actual = record_with_pdf.data["text_from_pdf"]
+    three_pages_len = len(actual)
     actual = actual[0:4219]
     assert expected == actual
 
+    record_with_pdf.set_text_from_pdf(max_pages=1)
+    actual = record_with_pdf.data["text_from_pdf"]
+    assert len(actual) < three_pages_len
+    assert expected == actual[0:4219]
+
 
 def test_extract_text_by_page(  # type: ignore
     helpers, record_with_pdf: colrev.record.record_pdf.PDFRecord
@@ -48,6 +54,8 @@ def test_extract_text_by_page(  # type: ignore
     ).read_text(encoding="utf-8")
     actual = record_with_pdf.extract_text_by_page(pages=[0])
     actual = actual.rstrip()
+    # Pages that are not in the PDF are skipped
+    assert actual == record_with_pdf.extract_text_by_page(pages=[0, 100]).rstrip()
     if expected != actual:
         (
             helpers.test_data_path
@@ -69,6 +69,24 @@ def test_get_year_from_toc(local_index) -> None:  # type: ignore
 # TODO retrieve
 
 
+def test_retrieve_many(local_index) -> None:  # type: ignore
+    """Test retrieve_many()"""
+
+    indexed_record_dict = {
+        Fields.ID: "AbbasZhouDengEtAl2018",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.DOI: "10.25300/MISQ/2018/13239",
+    }
+    missing_record_dict = {
+        Fields.ID: "Missing2012",
+        Fields.ENTRYTYPE: ENTRYTYPES.ARTICLE,
+        Fields.DOI: "10.0000/NOT-IN-INDEX",
+    }
+    expected = [local_index.retrieve(indexed_record_dict), None]
+    actual = local_index.retrieve_many([indexed_record_dict, missing_record_dict])
+    assert expected == actual
+
+
 def test_retrieve_based_on_colrev_pdf_id(local_index) -> None:  # type: ignore
     """Test retrieve_based_on_colrev_pdf_id()"""
 
@@ -57,6 +57,41 @@ class LoadFormatterTests(unittest.TestCase):
         self.assertEqual(record.data[Fields.LANGUAGE], "eng")
         self.assertEqual(record.data[Fields.NUMBER], "1")
 
+    def test_format_doi(self) -> None:
+        for doi, expected in [
+            ("10.1234/ABC", "10.1234/ABC"),
+            ("http://dx.doi.org/10.1234/abc", "10.1234/ABC"),
+            ("https://dx.doi.org/10.1234/abc", "10.1234/ABC"),
+            ("http://doi.org/10.1234/abc", "10.1234/ABC"),
+            ("https://doi.org/10.1234/abc", "10.1234/ABC"),
+            ("https://www.doi.org/10.1234/abc", "HTTPS://WWW.DOI.ORG/10.1234/ABC"),
+        ]:
+            with self.subTest(doi=doi):
+                record = Record(
+                    {
+                        Fields.DOI: doi,
+                        Fields.STATUS: RecordState.md_processed,
+                    }
+                )
+                self.load_formatter.run(record=record)
+                self.assertEqual(record.data[Fields.DOI], expected)
+
+    def test_unescape_html_multiline_abstract(self) -> None:
+        record = Record(
+            {
+                Fields.STATUS: RecordState.md_retrieved,
+                Fields.ABSTRACT: "Effects were significant (p < 0.05).\n"
+                "In <i>group A</i>, scores > baseline.",
+            }
+        )
+
+        self.load_formatter.run(record=record)
+
+        self.assertEqual(
+            record.data[Fields.ABSTRACT],
+            "Effects were significant (p < 0.05). In group A, scores > baseline.",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
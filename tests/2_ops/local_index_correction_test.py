@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""Tests of the corrections of curated repositories (LocalIndex)"""
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import git
+
+import colrev.packages.local_index.src.local_index_correction
+from colrev.constants import Fields
+
+# pylint: disable=protected-access
+
+
+def test_apply_change_item_correction_one_branch(tmp_path) -> None:  # type: ignore
+    """Test that the corrections of a repository are pushed in one branch"""
+
+    remote_repo = git.Repo.init(tmp_path / Path("remote"), bare=True)
+    git_repo = git.Repo.init(tmp_path / Path("repo"))
+    git_repo.config_writer().set_value("user", "name", "test").release()
+    git_repo.config_writer().set_value("user", "email", "test@test.org").release()
+    git_repo.index.commit("init")
+    git_repo.create_remote("origin", remote_repo.working_dir)
+
+    records = {
+        "Rec1": {Fields.ID: "Rec1", Fields.TITLE: "Title one"},
+        "Rec2": {Fields.ID: "Rec2", Fields.TITLE: "Title two"},
+    }
+
+    def create_commit(msg: str, script_call: str) -> None:
+        git_repo.index.commit(msg)
+
+    check_operation = MagicMock()
+    check_operation.review_manager.dataset.get_repo.return_value = git_repo
+    check_operation.review_manager.dataset.load_records_dict.return_value = records
+    check_operation.review_manager.dataset.create_commit.side_effect = create_commit
+
+    local_index_source = MagicMock()
+    local_index_source.essential_md_keys = [Fields.TITLE, Fields.DOI]
+    local_index_source.search_source.get_api_feed.return_value.feed_records = {
+        "1": {Fields.CURATION_ID: "https://github.com/example/repo#Rec1"},
+        "2": {Fields.CURATION_ID: "https://github.com/example/repo#Rec2"},
+    }
+
+    change_list = []
+    for origin_id, change in [
+        ("1", ("change", Fields.TITLE, ["Title one", "Title one (corrected)"])),
+        ("1", ("add", "", [(Fields.DOI, "10.1000/1")])),
+        ("2", ("change", Fields.TITLE, ["Title two", "Title two (corrected)"])),
+    ]:
+        change_file = tmp_path / Path(f"{len(change_list)}.json")
+        change_file.write_text("{}", encoding="utf-8")
+        change_list.append(
+            {
+                "original_record": {
+                    Fields.ID: f"Rec{origin_id}",
+                    Fields.ORIGIN: [f"md_curated.bib/{origin_id}"],
+                },
+                "changes": [change],
+                Fields.FILE: str(change_file),
+            }
+        )
+
+    correction = (
+        colrev.packages.local_index.src.local_index_correction.LocalIndexCorrection(
+            local_index_source=local_index_source
+        )
+    )
+    correction._get_record_index = MagicMock()  # type: ignore
+
+    assert correction._apply_change_item_correction(
+        check_operation=check_operation, change_list=change_list
+    )
+
+    # One branch (one commit per record) is pushed and removed locally
+    assert [head.name for head in remote_repo.heads] == ["Rec1"]
+    assert [
+        commit.message for commit in remote_repo.iter_commits("Rec1", max_count=2)
+    ] == ["Update Rec2", "Update Rec1"]
+    assert [head.name for head in git_repo.heads] == [git_repo.active_branch.name]
+    assert check_operation.review_manager.dataset.create_commit.call_count == 2
+
+    # The records are reset and the change items are removed
+    assert records["Rec1"] == {Fields.ID: "Rec1", Fields.TITLE: "Title one"}
+    assert records["Rec2"] == {Fields.ID: "Rec2", Fields.TITLE: "Title two"}
+    assert not any(Path(item[Fields.FILE]).is_file() for item in change_list)
+
+    # The md_curated origins identify the records (no record index is needed)
+    correction._get_record_index.assert_not_called()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""Test the unknown_source prep utilities"""
+from pathlib import Path
+
+import pytest
+
+import colrev.ops.prep
+import colrev.packages.unknown_source.src.unknown_source
+import colrev.record.record_prep
+from colrev.constants import Fields
+from colrev.constants import SearchType
+
+# pylint: disable=protected-access
+# flake8: noqa: E501
+
+UnknownSearchSource = (
+    colrev.packages.unknown_source.src.unknown_source.UnknownSearchSource
+)
+
+
+@pytest.fixture(scope="package", name="unknown_source")
+def fixture_unknown_source(
+    prep_operation: colrev.ops.prep.Prep,
+) -> UnknownSearchSource:
+    """Fixture returning an UnknownSearchSource instance"""
+    settings = {
+        "endpoint": "colrev.unknown_source",
+        "filename": Path("data/search/unknown.bib"),
+        "search_type": SearchType.DB,
+        "search_parameters": {},
+        "comment": "",
+    }
+    return UnknownSearchSource(source_operation=prep_operation, settings=settings)
+
+
+@pytest.mark.parametrize(
+    "input_value, expected",
+    [
+        ("Effects <i\nclass='x'>strong</i> here", "Effects strong here"),
+        ("Effects  of\n<b>IT</b>  use ", "Effects of IT use"),
+    ],
+)
+def test_unify_special_characters(
+    unknown_source: UnknownSearchSource,
+    input_value: str,
+    expected: str,
+) -> None:
+    """Test the removal of html tags and whitespace"""
+    record = colrev.record.record_prep.PrepRecord(
+        {Fields.ID: "r1", Fields.ENTRYTYPE: "article", Fields.TITLE: input_value}
+    )
+    unknown_source._unify_special_characters(record=record)
+    assert record.data[Fields.TITLE] == expected
+
+
+@pytest.mark.parametrize(
+    "input_value, expected",
+    [
+        ("Doe, John (Johnny) and Smith, Jane", "Doe, John and Smith, Jane"),
+        ("Doe, John and Smith, Jane (JS)", "Doe, John and Smith, Jane"),
+    ],
+)
+def test_author_nicknames(
+    unknown_source: UnknownSearchSource,
+    input_value: str,
+    expected: str,
+) -> None:
+    """Test the removal of nicknames from the author field"""
+    record = colrev.record.record_prep.PrepRecord(
+        {Fields.ID: "r1", Fields.ENTRYTYPE: "misc", Fields.AUTHOR: input_value}
+    )
+    unknown_source._format_fields(record=record)
+    assert record.data[Fields.AUTHOR] == expected
+
+
+@pytest.mark.parametrize(
+    "input_value, expected",
+    [
+        (
+            "Proceedings of the 41st International Conference on Information Systems (ICIS2020)",
+            "International Conference on Information Systems",
+        ),
+        (
+            "Proceedings of the International Conference on Information Systems (ICIS)",
+            "International Conference on Information Systems",
+        ),
+        ("Wirtschaftsinformatik 2019", "Wirtschaftsinformatik"),
+    ],
+)
+def test_format_inproceedings_booktitle(
+    unknown_source: UnknownSearchSource,
+    input_value: str,
+    expected: str,
+) -> None:
+    """Test the removal of years, ordinals, and acronyms from booktitles"""
+    record = colrev.record.record_prep.PrepRecord(
+        {
+            Fields.ID: "r1",
+            Fields.ENTRYTYPE: "inproceedings",
+            Fields.BOOKTITLE: input_value,
+        }
+    )
+    unknown_source._format_inproceedings(record=record)
+    assert record.data[Fields.BOOKTITLE] == expected